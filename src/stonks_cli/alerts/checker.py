@@ -137,7 +137,8 @@ def check_all_alerts() -> list[tuple[Alert, bool]]:
 
     from stonks_cli.alerts.storage import load_alerts
     from stonks_cli.config import load_config
-    from stonks_cli.pipeline import provider_for_config
+    from stonks_cli.data.ratelimit import RateLimiter
+    from stonks_cli.pipeline import provider_for_config, providers_for_tickers
 
     alerts = [a for a in load_alerts() if a.enabled]
     if not alerts:
@@ -147,10 +148,18 @@ def check_all_alerts() -> list[tuple[Alert, bool]]:
     tickers = list(set(a.ticker for a in alerts))
     data: dict[str, pd.DataFrame] = {}
     cfg = load_config()
+    limiter = RateLimiter(cfg.data.max_requests_per_second)
+    try:
+        providers = providers_for_tickers(cfg, tickers)
+    except Exception as e:
+        # Fall back to per-ticker resolution so one bad override doesn't block every alert.
+        log_suppressed_exception(context="alerts.check_all_alerts.providers", error=e)
+        providers = {}
 
     def _fetch(t: str):
         try:
-            p = provider_for_config(cfg, t)
+            p = providers.get(t) or provider_for_config(cfg, t)
+            limiter.acquire()
             # Fetch enough history for RSI (at least 15 days, say 30)
             # Provider fetch_daily usually fetches max or substantial history
             # We assume it fetches efficiently
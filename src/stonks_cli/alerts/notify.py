@@ -5,7 +5,6 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-import platformdirs
 from rich.console import Console
 
 from stonks_cli.alerts.models import Alert
@@ -20,10 +19,14 @@ def notify_terminal_bell(alert: Alert) -> None:
     print("\a")
 
 
+def _data_dir() -> Path:
+    from stonks_cli.paths import default_data_dir
+
+    return default_data_dir()
+
+
 def get_alerts_log_path() -> Path:
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "alerts_log.jsonl"
+    return _data_dir() / "alerts_log.jsonl"
 
 
 def log_alert_trigger(alert: Alert) -> None:
@@ -3,17 +3,19 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import platformdirs
-
 from stonks_cli.alerts.models import Alert
 from stonks_cli.logging_utils import log_suppressed_exception
 
 
+def _data_dir() -> Path:
+    from stonks_cli.paths import default_data_dir
+
+    return default_data_dir()
+
+
 def get_alerts_path() -> Path:
     """Get platform-appropriate path to alerts.json."""
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "alerts.json"
+    return _data_dir() / "alerts.json"
 
 
 def load_alerts() -> list[Alert]:
@@ -51,6 +53,22 @@ def save_alert(alert: Alert) -> None:
     _save_all_alerts(alerts)
 
 
+def save_alerts(updated: list[Alert]) -> None:
+    """Append or update several alerts with a single read and write."""
+    if not updated:
+        return
+    alerts = load_alerts()
+    index = {a.id: i for i, a in enumerate(alerts)}
+    for alert in updated:
+        idx = index.get(alert.id)
+        if idx is not None:
+            alerts[idx] = alert
+        else:
+            index[alert.id] = len(alerts)
+            alerts.append(alert)
+    _save_all_alerts(alerts)
+
+
 def delete_alert(alert_id: str) -> bool:
     """Remove alert by ID. Returns True if found and removed."""
     alerts = load_alerts()
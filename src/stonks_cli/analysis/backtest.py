@@ -4,6 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from functools import partial
 
+import numpy as np
 import pandas as pd
 
 from stonks_cli.analysis.strategy import Recommendation
@@ -93,28 +94,39 @@ def walk_forward_backtest(
         return BacktestSeries(equity=equity, position=position)
 
     close = df["close"].astype(float)
-    rets = close.pct_change().fillna(0.0)
+    if close.isna().any():
+        # Returns across a gap are measured from the last valid close, as pct_change's padding did.
+        close = close.ffill()
+    close_np = close.to_numpy(dtype=float)
+    rets = np.zeros(len(close_np))
+    rets[1:] = close_np[1:] / close_np[:-1] - 1.0
+    rets[np.isnan(rets)] = 0.0
 
     position = _vectorized_position_if_supported(df, strategy_fn=strategy_fn, min_history_rows=min_history_rows)
     if position is None:
-        position = pd.Series(0.0, index=df.index)
-        for i in range(len(df)):
-            if i < min_history_rows:
-                position.iloc[i] = 0.0
-                continue
-            window = df.iloc[: i + 1]
-            rec = strategy_fn(window)
-            position.iloc[i] = _action_to_position(rec.action)
-
-    strat_rets = rets * position.shift(1).fillna(0.0)
-
-    total_cost_bps = float(fee_bps) + float(slippage_bps)
-    if total_cost_bps > 0:
-        cost_rate = total_cost_bps / 10000.0
-        turnover = (position - position.shift(1).fillna(0.0)).abs()
-        strat_rets = strat_rets - (turnover * cost_rate)
-    equity = (1.0 + strat_rets).cumprod()
-    return BacktestSeries(equity=equity, position=position)
+        # Unknown/plugin strategies still see expanding DataFrame windows, but positions are
+        # collected in a plain array rather than set one Series cell at a time.
+        pos = np.zeros(len(df), dtype=float)
+        for i in range(max(0, min_history_rows), len(df)):
+            pos[i] = _action_to_position(strategy_fn(df.iloc[: i + 1]).action)
+        position = pd.Series(pos, index=df.index)
+
+    equity = _equity_from_returns(
+        rets,
+        position.to_numpy(dtype=float),
+        cost_rate=(float(fee_bps) + float(slippage_bps)) / 10000.0,
+    )
+    return BacktestSeries(equity=pd.Series(equity, index=df.index), position=position)
+
+
+def _equity_from_returns(rets: np.ndarray, pos: np.ndarray, *, cost_rate: float = 0.0) -> np.ndarray:
+    """Equity curve from per-bar returns, holding position(t-1) over bar t and charging turnover costs."""
+    prev = np.zeros_like(pos)
+    prev[1:] = pos[:-1]
+    strat_rets = rets * prev
+    if cost_rate > 0:
+        strat_rets = strat_rets - np.abs(pos - prev) * cost_rate
+    return np.cumprod(1.0 + strat_rets)
 
 
 def _vectorized_position_if_supported(
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+import numpy as np
 import pandas as pd
 
 
@@ -7,6 +10,25 @@ def sma(series: pd.Series, window: int) -> pd.Series:
     return series.rolling(window=window, min_periods=window).mean()
 
 
+def sma_many(series: pd.Series, windows: Iterable[int]) -> dict[int, pd.Series]:
+    """Compute several SMAs from a single cumulative sum of the series.
+
+    Matches ``sma`` for gap-free input; falls back to it when the series has NaNs.
+    """
+    x = series.to_numpy(dtype=np.float64)
+    if np.isnan(x).any():
+        return {int(w): sma(series, int(w)) for w in windows}
+    cs = np.concatenate(([0.0], np.cumsum(x)))
+    out: dict[int, pd.Series] = {}
+    for w in windows:
+        w = int(w)
+        vals = np.full(len(x), np.nan)
+        if 0 < w <= len(x):
+            vals[w - 1 :] = (cs[w:] - cs[:-w]) / w
+        out[w] = pd.Series(vals, index=series.index)
+    return out
+
+
 def ema(series: pd.Series, span: int) -> pd.Series:
     return series.ewm(span=span, adjust=False, min_periods=span).mean()
 
@@ -38,6 +60,33 @@ def bollinger_bands(close: pd.Series, window: int = 20, num_std: float = 2.0) ->
     return lower, mid, upper
 
 
+def bollinger_bands_cumsum(
+    close: pd.Series, window: int = 20, num_std: float = 2.0
+) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Bollinger Bands from running sums of x and x**2 in one vectorized sweep.
+
+    Uses the sample standard deviation like ``bollinger_bands``; falls back to it when
+    the series has NaNs.
+    """
+    x = close.to_numpy(dtype=np.float64)
+    n = len(x)
+    if np.isnan(x).any() or window < 2:
+        return bollinger_bands(close, window=window, num_std=num_std)
+    mid = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if window <= n:
+        s1 = np.concatenate(([0.0], np.cumsum(x)))
+        s2 = np.concatenate(([0.0], np.cumsum(x * x)))
+        win_sum = s1[window:] - s1[:-window]
+        win_sq = s2[window:] - s2[:-window]
+        mid[window - 1 :] = win_sum / window
+        var = (win_sq - (win_sum * win_sum) / window) / (window - 1)
+        std[window - 1 :] = np.sqrt(np.maximum(var, 0.0))
+    mid_s = pd.Series(mid, index=close.index)
+    std_s = pd.Series(std, index=close.index)
+    return mid_s - (num_std * std_s), mid_s, mid_s + (num_std * std_s)
+
+
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
     prev_close = close.shift(1)
     tr = pd.concat(
@@ -57,6 +106,40 @@ def rolling_volatility(close: pd.Series, window: int = 20, periods_per_year: int
     return vol * (periods_per_year**0.5)
 
 
+def last_atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> float:
+    """Latest value of ``atr`` computed from the trailing ``window + 1`` rows only.
+
+    Falls back to the full rolling computation when the tail contains NaNs.
+    """
+    n = len(close)
+    if n < window:
+        return float("nan")
+    start = max(0, n - window - 1)
+    h = high.to_numpy(dtype=np.float64)[start:]
+    lo = low.to_numpy(dtype=np.float64)[start:]
+    c = close.to_numpy(dtype=np.float64)[start:]
+    if np.isnan(h).any() or np.isnan(lo).any() or np.isnan(c).any():
+        return float(atr(high, low, close, window=window).to_numpy()[-1])
+    prev = np.concatenate(([np.nan], c[:-1]))
+    # fmax skips the missing previous close on the very first row, like DataFrame.max(axis=1).
+    tr = np.fmax(np.fmax(np.abs(h - lo), np.abs(h - prev)), np.abs(lo - prev))
+    return float(tr[-window:].mean())
+
+
+def last_rolling_volatility(close: pd.Series, window: int = 20, periods_per_year: int = 252) -> float:
+    """Latest value of ``rolling_volatility`` computed from the trailing ``window + 1`` closes only.
+
+    Falls back to the full rolling computation when the tail contains NaNs.
+    """
+    if len(close) < window + 1 or window < 2:
+        return float(rolling_volatility(close, window=window, periods_per_year=periods_per_year).to_numpy()[-1])
+    c = close.to_numpy(dtype=np.float64)[-(window + 1) :]
+    if np.isnan(c).any():
+        return float(rolling_volatility(close, window=window, periods_per_year=periods_per_year).to_numpy()[-1])
+    rets = c[1:] / c[:-1] - 1.0
+    return float(rets.std(ddof=1) * (periods_per_year**0.5))
+
+
 def max_drawdown(close: pd.Series, window: int = 252) -> pd.Series:
     roll_max = close.rolling(window=window, min_periods=window).max()
     dd = (close / roll_max) - 1.0
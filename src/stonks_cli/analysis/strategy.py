@@ -26,7 +26,7 @@ _rsi_col = rsi_col
 _bb_cols = bb_cols
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     action: str
     confidence: float
@@ -116,8 +116,11 @@ def sma_cross_strategy(df: pd.DataFrame, fast: int = 20, slow: int = 50) -> Reco
 
     fast_col = sma_col(fast)
     slow_col = sma_col(slow)
-    fast_sma = df[fast_col] if fast_col in df.columns else sma(close, fast)
-    slow_sma = df[slow_col] if slow_col in df.columns else sma(close, slow)
+    # Only the last two SMA values are read, so without precomputed columns roll over just enough
+    # trailing rows rather than the whole history (walk-forward calls this on every expanding window).
+    tail = close.iloc[-(max(fast, slow) + 1) :]
+    fast_sma = df[fast_col] if fast_col in df.columns else sma(tail, fast)
+    slow_sma = df[slow_col] if slow_col in df.columns else sma(tail, slow)
     prev_fast, cur_fast = fast_sma.iloc[-2], fast_sma.iloc[-1]
     prev_slow, cur_slow = slow_sma.iloc[-2], slow_sma.iloc[-1]
     last = float(close.iloc[-1])
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pandas as pd
 import plotext as plt
 
-from stonks_cli.analysis.indicators import bollinger_bands, sma
+from stonks_cli.analysis.indicators import bollinger_bands_cumsum, sma_many
 
 
 def plot_price_history(
@@ -45,17 +45,15 @@ def plot_price_history(
     # Plot SMA overlays
     sma_colors = ["green", "yellow", "red", "cyan", "magenta"]
     if sma_periods:
-        close_series = data["close"]
+        sma_by_period = sma_many(data["close"], sma_periods)
         for i, period in enumerate(sma_periods):
-            sma_values = sma(close_series, period)
-            sma_list = sma_values.tolist()
+            sma_list = sma_by_period[int(period)].tolist()
             color = sma_colors[i % len(sma_colors)]
             plt.plot(sma_list, label=f"SMA{period}", color=color)
 
     # Plot Bollinger Bands
     if show_bb:
-        close_series = data["close"]
-        lower, mid, upper = bollinger_bands(close_series, window=20, num_std=2.0)
+        lower, mid, upper = bollinger_bands_cumsum(data["close"], window=20, num_std=2.0)
         plt.plot(lower.tolist(), label="BB Lower", color="blue")
         plt.plot(mid.tolist(), label="BB Mid", color="cyan")
         plt.plot(upper.tolist(), label="BB Upper", color="blue")
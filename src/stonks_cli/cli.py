@@ -93,6 +93,11 @@ def _global_options(
     configure_logging(LoggingConfig(verbose=verbose, quiet=quiet, structured=structured_logs))
 
 
+def _echo_report(path: Path) -> None:
+    """Show a written report on the terminal exactly as it was saved."""
+    typer.echo(path.read_text(encoding="utf-8"), nl=False)
+
+
 def _exit_for_error(e: Exception) -> typer.Exit:
     if isinstance(e, StonksError):
         Console().print(f"[red]Error:[/red] {e}")
@@ -700,6 +705,7 @@ def watchlist_analyze(
             csv_out=csv_out,
             sandbox=sandbox,
         )
+        _echo_report(artifacts.report_path)
         Console().print(f"Wrote report: {artifacts.report_path}")
         if artifacts.json_path:
             Console().print(f"Wrote json: {artifacts.json_path}")
@@ -880,11 +886,12 @@ def analyze(
                 sandbox=sandbox,
                 benchmark=benchmark,
             )
+            _echo_report(artifacts.report_path)
             Console().print(f"Wrote report: {artifacts.report_path}")
             if artifacts.json_path:
                 Console().print(f"Wrote json: {artifacts.json_path}")
             return
-        do_analyze(
+        report_path = do_analyze(
             tickers if tickers else None,
             out_dir=Path(out_dir),
             start=start,
@@ -894,6 +901,7 @@ def analyze(
             sandbox=sandbox,
             benchmark=benchmark,
         )
+        _echo_report(report_path)
     except Exception as e:
         raise _exit_for_error(e)
 
@@ -913,6 +921,7 @@ def backtest(
             end=end,
             out_dir=Path(out_dir),
         )
+        _echo_report(path)
         Console().print(f"Wrote backtest: {path}")
     except Exception as e:
         raise _exit_for_error(e)
@@ -955,7 +964,8 @@ def schedule_once(
 ) -> None:
     """Run one analysis+report (same as a single scheduled job)."""
     try:
-        do_schedule_once(out_dir=Path(out_dir), sandbox=sandbox, report_name=name, csv_out=csv_out)
+        report_path = do_schedule_once(out_dir=Path(out_dir), sandbox=sandbox, report_name=name, csv_out=csv_out)
+        _echo_report(report_path)
     except Exception as e:
         raise _exit_for_error(e)
 
@@ -1395,7 +1405,7 @@ def paper_reset(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Reset paper trading portfolio."""
-    from stonks_cli.portfolio.paper import get_paper_history_path, get_paper_portfolio_path
+    from stonks_cli.portfolio.paper import reset_paper_portfolio
 
     if not force:
         typer.confirm(
@@ -1403,13 +1413,7 @@ def paper_reset(
             abort=True,
         )
 
-    p_path = get_paper_portfolio_path()
-    h_path = get_paper_history_path()
-
-    if p_path.exists():
-        p_path.unlink()
-    if h_path.exists():
-        h_path.unlink()
+    reset_paper_portfolio()
 
     Console().print("[green]Paper portfolio reset successfully.[/green]")
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import asdict, dataclass
 from datetime import UTC, date, datetime
 from pathlib import Path
@@ -21,7 +22,14 @@ from stonks_cli.reporting.json_report import write_json_report
 from stonks_cli.reporting.report import write_text_report
 from stonks_cli.scheduler.run import SchedulerHandle, run_scheduler, start_scheduler_in_thread
 from stonks_cli.scheduler.tz import cron_trigger_from_config, resolve_timezone
-from stonks_cli.storage import get_history_record, get_last_report_path, get_last_run, list_history, save_last_run
+from stonks_cli.storage import (
+    get_history_record,
+    get_last_report_path,
+    get_last_run,
+    iter_history,
+    list_history,
+    save_last_run,
+)
 
 
 @dataclass(frozen=True)
@@ -913,6 +921,10 @@ def do_history_list(limit: int = 20):
     return list_history(limit=limit)
 
 
+def do_history_iter(limit: int = 20):
+    return iter_history(limit=limit)
+
+
 def do_history_show(index: int, *, limit: int = 2000):
     return get_history_record(index, limit=limit)
 
@@ -1015,24 +1027,31 @@ def do_data_verify(tickers: list[str] | None) -> dict[str, str]:
 
 
 def do_data_cache_info() -> dict[str, object]:
+    import heapq
+    import os
+
     from stonks_cli.paths import default_cache_dir
 
     cache_dir = default_cache_dir()
     if not cache_dir.exists():
         return {"cache_dir": str(cache_dir), "entries": 0, "size_bytes": 0, "examples": []}
 
-    files = [p for p in cache_dir.glob("*.json") if p.is_file()]
+    names: list[str] = []
     size_bytes = 0
-    for p in files:
-        try:
-            size_bytes += p.stat().st_size
-        except Exception as e:
-            log_suppressed_exception(context="commands.data_cache_info.stat", error=e, path=p)
-            continue
-    examples = [p.name for p in sorted(files)[:3]]
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            names.append(entry.name)
+            try:
+                size_bytes += entry.stat().st_size
+            except Exception as e:
+                log_suppressed_exception(context="commands.data_cache_info.stat", error=e, path=entry.path)
+                continue
+    examples = heapq.nsmallest(3, names)
     return {
         "cache_dir": str(cache_dir),
-        "entries": len(files),
+        "entries": len(names),
         "size_bytes": size_bytes,
         "examples": examples,
     }
@@ -1078,7 +1097,7 @@ def do_portfolio_remove(ticker: str, shares: float, sale_price: float) -> dict:
 
 
 def do_portfolio_show(include_total: bool = False) -> dict:
-    """Get portfolio positions with current prices."""
+    """Get portfolio positions with current prices (plain floats/strs, ready for JSON)."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from stonks_cli.portfolio.storage import load_portfolio
@@ -1166,7 +1185,7 @@ def do_portfolio_show(include_total: bool = False) -> dict:
 
 
 def do_portfolio_allocation() -> dict:
-    """Get portfolio allocation percentages."""
+    """Get portfolio allocation percentages (plain floats, ready for JSON)."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from stonks_cli.portfolio.analysis import calculate_portfolio_allocation
@@ -1271,10 +1290,10 @@ def do_paper_sell(ticker: str, shares: float) -> dict:
 
 
 def do_paper_status() -> dict:
-    """Get paper portfolio status summary."""
+    """Get paper portfolio status summary (plain floats/strs, ready for JSON)."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    from stonks_cli.portfolio.paper import get_paper_history_path, load_paper_portfolio
+    from stonks_cli.portfolio.paper import load_paper_portfolio, paper_initial_cash
 
     portfolio = load_paper_portfolio()
     cfg = load_config()
@@ -1328,20 +1347,7 @@ def do_paper_status() -> dict:
     total_portfolio_value = total_market_value + portfolio.cash_balance
 
     # Calculate Initial Cash from history
-    initial_cash = 0.0
-    hist_path = get_paper_history_path()
-    if hist_path.exists():
-        with open(hist_path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                    if rec.get("action") == "INIT":
-                        initial_cash += rec.get("shares", 0.0)
-                except Exception as e:
-                    log_suppressed_exception(context="commands.paper_status.parse_history", error=e)
-
-    if initial_cash == 0:
-        initial_cash = 10000.0  # Fallback
+    initial_cash = paper_initial_cash()
 
     overall_pl = total_portfolio_value - initial_cash
     overall_pl_pct = (overall_pl / initial_cash * 100) if initial_cash > 0 else 0
@@ -1360,25 +1366,13 @@ def do_paper_leaderboard() -> dict:
     """Get metrics for leaderboard."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    from stonks_cli.portfolio.paper import calculate_paper_performance, get_paper_history_path, load_paper_portfolio
+    from stonks_cli.portfolio.paper import calculate_paper_performance, load_paper_portfolio, paper_initial_cash
 
     portfolio = load_paper_portfolio()
     cfg = load_config()
 
     # Get Initial Cash
-    initial_cash = 0.0
-    h_path = get_paper_history_path()
-    if h_path.exists():
-        with open(h_path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                    if rec.get("action") == "INIT":
-                        initial_cash += rec.get("shares", 0.0)
-                except Exception as e:
-                    log_suppressed_exception(context="commands.paper_leaderboard.parse_history", error=e)
-    if initial_cash == 0:
-        initial_cash = 10000.0
+    initial_cash = paper_initial_cash()
 
     # Fetch prices
     tickers = list(set(p.ticker for p in portfolio.positions))
@@ -1483,33 +1477,35 @@ def do_alert_check() -> list[dict]:
 
     from stonks_cli.alerts.checker import check_all_alerts
     from stonks_cli.alerts.notify import log_alert_trigger, notify_terminal_bell, notify_webhook
-    from stonks_cli.alerts.storage import save_alert
+    from stonks_cli.alerts.storage import save_alerts
 
     cfg = load_config()
     results = check_all_alerts()
-    triggered = []
+    newly_triggered = [alert for alert, is_triggered in results if is_triggered and alert.triggered_at is None]
 
-    for alert, is_triggered in results:
-        if is_triggered and alert.triggered_at is None:
-            # Mark as triggered
-            alert.triggered_at = datetime.now()
-            save_alert(alert)
-
-            # Send notifications
-            notify_terminal_bell(alert)
-            log_alert_trigger(alert)
-
-            # Send webhook if configured
-            if cfg.webhook_url:
-                notify_webhook(alert, cfg.webhook_url)
-
-            triggered.append(alert.to_dict())
-            track_event(
-                "commands.alert.triggered",
-                ticker=alert.ticker,
-                condition=alert.condition_type,
-                threshold=alert.threshold,
-            )
+    # Mark as triggered and persist in one write before notifying.
+    now = datetime.now()
+    for alert in newly_triggered:
+        alert.triggered_at = now
+    save_alerts(newly_triggered)
+
+    triggered = []
+    for alert in newly_triggered:
+        # Send notifications
+        notify_terminal_bell(alert)
+        log_alert_trigger(alert)
+
+        # Send webhook if configured
+        if cfg.webhook_url:
+            notify_webhook(alert, cfg.webhook_url)
+
+        triggered.append(alert.to_dict())
+        track_event(
+            "commands.alert.triggered",
+            ticker=alert.ticker,
+            condition=alert.condition_type,
+            threshold=alert.threshold,
+        )
 
     return triggered
 
@@ -1622,8 +1618,28 @@ def do_correlation(tickers: list[str], days: int = 252) -> dict:
     }
 
 
+_CREATED_AT_RE = re.compile(rb'^\{"created_at":\s*([0-9.eE+-]+)\s*[,}]')
+
+
+def _cache_entry_created_at(path: Path) -> float | None:
+    """Read an entry's created_at, usually from the first bytes of the file (it is the leading key).
+
+    Returns None when the entry cannot be read or parsed.
+    """
+    try:
+        with path.open("rb") as f:
+            m = _CREATED_AT_RE.match(f.read(64))
+        if m:
+            return float(m.group(1))
+        data = json.loads(path.read_bytes())
+        return float(data.get("created_at", 0))
+    except Exception as e:
+        log_suppressed_exception(context="commands.data_purge.read_entry", error=e, path=path)
+        return None
+
+
 def do_data_purge(*, older_than_days: int | None = None) -> dict[str, object]:
-    import json
+    import os
     import time
 
     from stonks_cli.paths import default_cache_dir
@@ -1639,30 +1655,33 @@ def do_data_purge(*, older_than_days: int | None = None) -> dict[str, object]:
         cutoff = time.time() - (older_than_days * 86400)
 
     deleted = 0
-    for p in cache_dir.glob("*.json"):
-        if not p.is_file():
-            continue
-        should_delete = cutoff is None
-        if cutoff is not None:
-            try:
-                data = json.loads(p.read_text(encoding="utf-8"))
-                created_at = float(data.get("created_at", 0))
-            except Exception as e:
-                log_suppressed_exception(context="commands.data_purge.read_entry", error=e, path=p)
-                try:
-                    created_at = float(p.stat().st_mtime)
-                except Exception as stat_err:
-                    log_suppressed_exception(context="commands.data_purge.stat_entry", error=stat_err, path=p)
-                    created_at = 0.0
-            should_delete = created_at <= cutoff
-
-        if should_delete:
-            try:
-                p.unlink(missing_ok=True)
-                deleted += 1
-            except Exception as e:
-                log_suppressed_exception(context="commands.data_purge.delete_entry", error=e, path=p)
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or not entry.is_file():
                 continue
+            should_delete = cutoff is None
+            if cutoff is not None:
+                # created_at decides; the file's mtime only stands in for entries that can't be read.
+                created_at = _cache_entry_created_at(Path(entry.path))
+                if created_at is None:
+                    try:
+                        created_at = entry.stat().st_mtime
+                    except Exception as stat_err:
+                        log_suppressed_exception(
+                            context="commands.data_purge.stat_entry", error=stat_err, path=entry.path
+                        )
+                        created_at = 0.0
+                should_delete = created_at <= cutoff
+
+            if should_delete:
+                try:
+                    os.unlink(entry.path)
+                    deleted += 1
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    log_suppressed_exception(context="commands.data_purge.delete_entry", error=e, path=entry.path)
+                    continue
 
     return {"cache_dir": str(cache_dir), "deleted": deleted}
 
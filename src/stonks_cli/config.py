@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -41,6 +42,9 @@ class DataConfig(BaseModel):
     plugin_name: str | None = Field(default=None, description="Provider key when provider='plugin'")
     cache_ttl_seconds: int = Field(default=3600, ge=0)
     concurrency_limit: int = Field(default=8, ge=1, le=64)
+    max_requests_per_second: float = Field(
+        default=0.0, ge=0.0, description="Cap on provider fetches per second for batch checks (0 disables)"
+    )
 
 
 class RiskConfig(BaseModel):
@@ -115,10 +119,24 @@ def config_path() -> Path:
 
 
 def load_config() -> AppConfig:
+    """Load and normalize the config file.
+
+    The parsed config is memoized per (path, mtime, size), so repeated loads within a process
+    skip JSON parsing and validation until the file changes. Callers treat the result as
+    read-only and derive variants with ``model_copy(update=...)``.
+    """
     path = config_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return AppConfig()
-    data = json.loads(path.read_text(encoding="utf-8"))
+    return _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    path = Path(path_str)
+    data = json.loads(path.read_bytes())
     cfg = AppConfig.model_validate(data)
     # Normalize tickers and override keys at the boundary.
     try:
@@ -4,6 +4,7 @@ import hashlib
 import json
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from stonks_cli.logging_utils import log_suppressed_exception
@@ -15,6 +16,7 @@ def default_cache_dir() -> Path:
     return _default_cache_dir()
 
 
+@lru_cache(maxsize=1024)
 def _key_to_name(key: str) -> str:
     digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
     return digest
@@ -28,10 +30,13 @@ class CacheEntry:
 
 def load_cached_text(cache_dir: Path, key: str, ttl_seconds: int) -> str | None:
     path = cache_dir / f"{_key_to_name(key)}.json"
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
         return None
+    # Freshness is decided by the recorded created_at alone (as in data purge), never by the file's mtime.
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(raw)
         created_at = float(data.get("created_at", 0))
         payload = data.get("payload")
         if not isinstance(payload, str):
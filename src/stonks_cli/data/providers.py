@@ -6,6 +6,7 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
@@ -36,9 +37,20 @@ class PriceSeries:
 
 
 class PriceProvider:
+    # Providers that can fetch many symbols in one request set this and override fetch_daily_batch.
+    supports_batch: bool = False
+
     def fetch_daily(self, ticker: str) -> PriceSeries:  # pragma: no cover
         raise NotImplementedError
 
+    def fetch_daily_batch(self, tickers: list[str]) -> dict[str, PriceSeries]:
+        """Fetch several tickers, keyed by normalized ticker. Default: one fetch_daily per ticker."""
+        out: dict[str, PriceSeries] = {}
+        for t in tickers:
+            series = self.fetch_daily(t)
+            out[series.ticker] = series
+        return out
+
 
 class StooqProvider(PriceProvider):
     def __init__(
@@ -127,22 +139,20 @@ class StooqProvider(PriceProvider):
 
 
 class YFinanceProvider(PriceProvider):
+    supports_batch = True
+
     def __init__(self, *, timeout_s: float = 30.0):
         self._timeout_s = timeout_s
 
-    def fetch_daily(self, ticker: str) -> PriceSeries:
-        normalized = normalize_ticker(ticker)
-        symbol = normalized.split(".")[0]
+    @staticmethod
+    def _yf():
         try:
-            yf = importlib.import_module("yfinance")
+            return importlib.import_module("yfinance")
         except Exception as e:
             raise ImportError("yfinance provider requires optional dependency: install stonks-cli[yfinance]") from e
 
-        # yfinance returns a DataFrame indexed by date with OHLCV columns.
-        df = yf.download(symbol, period="max", interval="1d", progress=False)
-        if df is None or getattr(df, "empty", True):
-            return PriceSeries(ticker=normalized, df=pd.DataFrame())
-
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame, normalized: str) -> pd.DataFrame:
         df = df.copy()
         df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
         try:
@@ -152,23 +162,95 @@ class YFinanceProvider(PriceProvider):
         keep = [c for c in ["open", "high", "low", "close", "volume"] if c in df.columns]
         if keep:
             df = df[keep]
-        return PriceSeries(ticker=normalized, df=df)
+        return df
+
+    def fetch_daily(self, ticker: str) -> PriceSeries:
+        normalized = normalize_ticker(ticker)
+        symbol = normalized.split(".")[0]
+        yf = self._yf()
+
+        # yfinance returns a DataFrame indexed by date with OHLCV columns.
+        df = yf.download(symbol, period="max", interval="1d", progress=False)
+        if df is None or getattr(df, "empty", True):
+            return PriceSeries(ticker=normalized, df=pd.DataFrame())
+        return PriceSeries(ticker=normalized, df=self._normalize_frame(df, normalized))
+
+    def fetch_daily_batch(self, tickers: list[str]) -> dict[str, PriceSeries]:
+        # Several tickers can share a yfinance symbol (X.US and X.L both download "X", as in
+        # fetch_daily), so keep every normalized ticker that maps to each symbol.
+        symbols: dict[str, list[str]] = {}
+        for t in tickers:
+            n = normalize_ticker(t)
+            group = symbols.setdefault(n.split(".")[0], [])
+            if n not in group:
+                group.append(n)
+        if len(symbols) <= 1:
+            return {n: self.fetch_daily(n) for group in symbols.values() for n in group}
+        yf = self._yf()
+
+        # One multi-symbol request; columns come back grouped as (symbol, field).
+        raw = yf.download(list(symbols), period="max", interval="1d", progress=False, group_by="ticker", threads=True)
+        out: dict[str, PriceSeries] = {}
+        for symbol, group in symbols.items():
+            df = pd.DataFrame()
+            if raw is not None and not getattr(raw, "empty", True):
+                try:
+                    df = raw[symbol].dropna(how="all")
+                except KeyError:
+                    df = pd.DataFrame()
+            for n in group:
+                out[n] = PriceSeries(ticker=n, df=self._normalize_frame(df, n) if not df.empty else df)
+        return out
 
 
 class CsvProvider(PriceProvider):
+    supports_batch = True
+
     def __init__(self, csv_path: str):
         self._path = csv_path
 
-    def fetch_daily(self, ticker: str) -> PriceSeries:
-        normalized = normalize_ticker(ticker)
+    def _read(self) -> pd.DataFrame:
         df = pd.read_csv(self._path)
         df.columns = [c.strip().lower() for c in df.columns]
-        if "ticker" in df.columns:
-            want = normalized
-            want_base = normalized.split(".")[0]
-            tickers = df["ticker"].astype(str).str.strip().str.upper()
-            df = df[(tickers == want) | (tickers == want_base)]
+        return df
+
+    @staticmethod
+    def _finish(df: pd.DataFrame, normalized: str) -> PriceSeries:
+        # Dates are parsed per ticker selection, so a malformed or differently formatted date under
+        # one ticker only affects that ticker.
         if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], utc=False)
-            df = df.set_index("date").sort_index()
+            df = df.assign(date=pd.to_datetime(df["date"], utc=False)).set_index("date").sort_index()
         return PriceSeries(ticker=normalized, df=df)
+
+    @staticmethod
+    def _row_positions(df: pd.DataFrame) -> dict[str, np.ndarray] | None:
+        """Row positions per ticker value: one grouping pass instead of a string mask per ticker."""
+        if "ticker" not in df.columns:
+            return None
+        col = df["ticker"].astype(str).str.strip().str.upper()
+        return col.groupby(col, sort=False).indices
+
+    def _select(self, df: pd.DataFrame, positions: dict[str, np.ndarray] | None, normalized: str) -> PriceSeries:
+        if positions is None:
+            return self._finish(df.copy(), normalized)
+        # Rows may carry the normalized ticker or its bare symbol (AAPL.US / AAPL).
+        keys = dict.fromkeys((normalized, normalized.split(".")[0]))
+        empty = np.empty(0, dtype=np.intp)
+        rows = np.sort(np.concatenate([positions.get(k, empty) for k in keys]))
+        return self._finish(df.iloc[rows], normalized)
+
+    def fetch_daily(self, ticker: str) -> PriceSeries:
+        normalized = normalize_ticker(ticker)
+        df = self._read()
+        return self._select(df, self._row_positions(df), normalized)
+
+    def fetch_daily_batch(self, tickers: list[str]) -> dict[str, PriceSeries]:
+        # Parse the file once, then look rows up per ticker.
+        df = self._read()
+        positions = self._row_positions(df)
+        out: dict[str, PriceSeries] = {}
+        for t in tickers:
+            normalized = normalize_ticker(t)
+            # Bad rows raise here exactly as in fetch_daily, so batched and per-ticker runs agree.
+            out[normalized] = self._select(df, positions, normalized)
+        return out
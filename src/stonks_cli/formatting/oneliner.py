@@ -12,6 +12,9 @@ ACTION_COLORS = {
     "INSUFFICIENT_HISTORY": "yellow",
 }
 
+# Rich markup for each known action, built once rather than per formatted line.
+_ACTION_STYLED = {action: f"[{color}]{action}[/{color}]" for action, color in ACTION_COLORS.items()}
+
 
 def format_quick_summary(
     ticker: str,
@@ -39,19 +42,15 @@ def format_quick_summary(
 
     # Format change percentage
     if change_pct is not None:
-        sign = "+" if change_pct >= 0 else ""
+        change_str = f"({change_pct:+.2f}%)"
         if use_color:
-            color = "green" if change_pct >= 0 else "red"
-            change_str = f"[{color}]({sign}{change_pct:.2f}%)[/{color}]"
-        else:
-            change_str = f"({sign}{change_pct:.2f}%)"
+            change_str = f"[green]{change_str}[/green]" if change_pct >= 0 else f"[red]{change_str}[/red]"
     else:
         change_str = "(N/A)"
 
     # Format action
     if use_color:
-        color = ACTION_COLORS.get(action, "white")
-        action_str = f"[{color}]{action}[/{color}]"
+        action_str = _ACTION_STYLED.get(action) or f"[white]{action}[/white]"
     else:
         action_str = action
 
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TextIO
+
+# Append handles kept open across writes, keyed by path.
+_handles: dict[Path, TextIO] = {}
+_lock = threading.Lock()
+
+
+def _same_file(fh: TextIO, path: Path) -> bool:
+    try:
+        a = os.fstat(fh.fileno())
+        b = os.stat(path)
+    except OSError:
+        return False
+    return (a.st_dev, a.st_ino) == (b.st_dev, b.st_ino)
+
+
+def append_jsonl(path: Path, entry: dict) -> None:
+    """Append one JSON record to ``path``, reusing an open handle between calls.
+
+    The handle is reopened if the file was removed or replaced (e.g. by a reset from
+    another process), and every record is flushed so readers see it immediately.
+    """
+    line = json.dumps(entry, separators=(",", ":")) + "\n"
+    with _lock:
+        fh = _handles.get(path)
+        if fh is None or fh.closed or not _same_file(fh, path):
+            if fh is not None and not fh.closed:
+                fh.close()
+            fh = open(path, "a", encoding="utf-8")
+            _handles[path] = fh
+        fh.write(line)
+        fh.flush()
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Write ``data`` as indented JSON, replacing ``path`` only once the new content is complete.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@atexit.register
+def close_all() -> None:
+    with _lock:
+        for fh in _handles.values():
+            fh.close()
+        _handles.clear()
@@ -11,7 +11,11 @@ Usage:
 
 from __future__ import annotations
 
-from datetime import datetime
+import threading
+import time
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
@@ -35,7 +39,7 @@ from stonks_cli.commands import (
     do_doctor,
     do_earnings,
     do_fundamentals,
-    do_history_list,
+    do_history_iter,
     do_insider,
     do_market_snapshot,
     do_movers,
@@ -66,6 +70,73 @@ from stonks_cli.config import load_config
 from stonks_cli.data.providers import normalize_ticker
 from stonks_cli.pipeline import provider_for_config
 
+# Tickers are normalized on every chart call; the universe seen in one session is small.
+_normalize = lru_cache(maxsize=4096)(normalize_ticker)
+
+# Short-lived in-process cache so chart tools called back-to-back share one fetch.
+_FETCH_TTL_SECONDS = 60.0
+_fetch_cache: dict[str, tuple[float, Any]] = {}
+_fetch_lock = threading.Lock()
+
+
+def _fetch_daily_cached(normalized: str) -> Any:
+    """Fetch daily prices for an already-normalized ticker, reusing recent results."""
+    now = time.monotonic()
+    with _fetch_lock:
+        hit = _fetch_cache.get(normalized)
+    if hit is not None and (now - hit[0]) < _FETCH_TTL_SECONDS:
+        return hit[1]
+    cfg = load_config()
+    provider = provider_for_config(cfg, normalized)
+    series = provider.fetch_daily(normalized)
+    with _fetch_lock:
+        _fetch_cache[normalized] = (now, series)
+    return series
+
+
+# Read-only getters that clients tend to poll; results are kept for a short TTL.
+_tool_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_tool_cache_lock = threading.Lock()
+
+_PORTFOLIO_TOOLS = ("get_portfolio", "get_portfolio_allocation", "get_paper_status", "get_paper_leaderboard")
+# get_config/list_plugins are not cached: load_config already tracks the config file's mtime, so
+# edits made outside this server show up on the next call.
+_CONFIG_TOOLS = ("get_schedule_status",)
+
+
+def _ttl_cache(seconds: float):
+    """Cache a tool's serialized result for ``seconds``, keyed on name and arguments."""
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with _tool_cache_lock:
+                hit = _tool_cache.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            result = fn(*args, **kwargs)
+            with _tool_cache_lock:
+                _tool_cache[key] = (now + seconds, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_tool_cache(*names: str) -> None:
+    """Drop cached results for the named tools."""
+    with _tool_cache_lock:
+        for key in [k for k in _tool_cache if k[0] in names]:
+            _tool_cache.pop(key, None)
+
+
+def _finite_list(values: Any) -> list[Any]:
+    """Convert a Series to a list with NaN warm-up values mapped to None."""
+    return [None if v != v else v for v in values.tolist()]
+
 
 def _default_out_dir() -> Path:
     """Return the default output directory for reports."""
@@ -80,19 +151,34 @@ mcp = FastMCP(
 
 
 def _serialize(obj: Any) -> Any:
-    """Convert objects to JSON-serializable format."""
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    if isinstance(obj, (list, tuple)):
-        return [_serialize(item) for item in obj]
+    """Convert objects to JSON-native primitives.
+
+    FastMCP encodes tool results with pydantic-core and falls back to ``str`` for
+    anything it does not recognise, so everything is reduced to dict/list/str/
+    int/float/bool/None here, including pandas and numpy values.
+    """
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
     if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
-    if isinstance(obj, datetime):
+        return {k if isinstance(k, str) else str(k): _serialize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_serialize(item) for item in obj]
+    if isinstance(obj, (datetime, date)):
         return obj.isoformat()
     if isinstance(obj, Path):
         return str(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _serialize(getattr(obj, f.name)) for f in fields(obj)}
+    if hasattr(obj, "columns") and hasattr(obj, "to_dict"):
+        # DataFrame: column -> list of values.
+        return {str(c): _serialize(obj[c].tolist()) for c in obj.columns}
+    if hasattr(obj, "tolist"):
+        # pandas Series / numpy arrays and scalars.
+        return _serialize(obj.tolist())
+    if hasattr(obj, "__dict__"):
+        return {k: _serialize(v) for k, v in vars(obj).items()}
     return obj
 
 
@@ -303,10 +389,10 @@ def get_chart_data(
         sma_periods: List of SMA periods to include (e.g., [20, 50, 200])
         show_bollinger: Include Bollinger Bands data
     """
-    cfg = load_config()
-    normalized = normalize_ticker(ticker)
-    provider = provider_for_config(cfg, normalized)
-    series = provider.fetch_daily(normalized)
+    from stonks_cli.analysis.indicators import bollinger_bands_cumsum, sma_many
+
+    normalized = _normalize(ticker)
+    series = _fetch_daily_cached(normalized)
 
     df = series.df.tail(days).copy()
     if df.empty:
@@ -326,6 +412,19 @@ def get_chart_data(
     if volume and "volume" in df.columns:
         result["volume"] = df["volume"].tolist()
 
+    # Overlays use full history so the visible window has warmed-up values.
+    close = series.df["close"]
+    if sma_periods:
+        result["sma"] = {str(p): _finite_list(s.tail(days)) for p, s in sma_many(close, sma_periods).items()}
+
+    if show_bollinger:
+        lower, mid, upper = bollinger_bands_cumsum(close, window=20, num_std=2.0)
+        result["bollinger"] = {
+            "lower": _finite_list(lower.tail(days)),
+            "mid": _finite_list(mid.tail(days)),
+            "upper": _finite_list(upper.tail(days)),
+        }
+
     return result
 
 
@@ -338,14 +437,12 @@ def get_chart_compare_data(tickers: list[str], days: int = 90) -> Any:
         tickers: List of ticker symbols to compare
         days: Number of days to display (default: 90)
     """
-    cfg = load_config()
     result: dict[str, Any] = {"dates": []}
 
     first = True
     for t in tickers:
-        normalized = normalize_ticker(t)
-        provider = provider_for_config(cfg, normalized)
-        df = provider.fetch_daily(normalized).df.tail(days)
+        normalized = _normalize(t)
+        df = _fetch_daily_cached(normalized).df.tail(days)
 
         if df.empty:
             continue
@@ -375,10 +472,8 @@ def get_chart_rsi_data(ticker: str, period: int = 14, days: int = 90) -> Any:
     """
     from stonks_cli.analysis.indicators import rsi
 
-    cfg = load_config()
-    normalized = normalize_ticker(ticker)
-    provider = provider_for_config(cfg, normalized)
-    df = provider.fetch_daily(normalized).df
+    normalized = _normalize(ticker)
+    df = _fetch_daily_cached(normalized).df
 
     if df.empty:
         return {"error": "No data found"}
@@ -394,6 +489,57 @@ def get_chart_rsi_data(ticker: str, period: int = 14, days: int = 90) -> Any:
     }
 
 
+@mcp.tool()
+def prefetch_chart_bundle(ticker: str, days: int = 90, period: int = 14) -> Any:
+    """
+    Get a coherent chart snapshot for a ticker from a single data fetch.
+    Combines close, candles, volume, RSI, SMA(20/50/200) and Bollinger Bands.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "AAPL")
+        days: Number of days to display (default: 90)
+        period: RSI period (default: 14)
+    """
+    from stonks_cli.analysis.indicators import bollinger_bands_cumsum, rsi, sma_many
+
+    normalized = _normalize(ticker)
+    df = _fetch_daily_cached(normalized).df
+
+    if df.empty or "close" not in df.columns:
+        return {"error": "No data found"}
+
+    # Indicators are computed over full history so the visible window has warmed-up values.
+    close = df["close"]
+    df_slice = df.tail(days)
+    result: dict[str, Any] = {
+        "ticker": normalized,
+        "dates": df_slice.index.strftime("%Y-%m-%d").tolist(),
+        "close": df_slice["close"].tolist(),
+        "rsi": rsi(close, period).tail(days).fillna(0).tolist(),
+        "sma": {str(p): _finite_list(s.tail(days)) for p, s in sma_many(close, (20, 50, 200)).items()},
+    }
+
+    if {"open", "high", "low"}.issubset(df.columns):
+        result["candles"] = {
+            "open": df_slice["open"].tolist(),
+            "high": df_slice["high"].tolist(),
+            "low": df_slice["low"].tolist(),
+            "close": result["close"],
+        }
+
+    if "volume" in df.columns:
+        result["volume"] = df_slice["volume"].tolist()
+
+    lower, mid, upper = bollinger_bands_cumsum(close, window=20, num_std=2.0)
+    result["bollinger"] = {
+        "lower": _finite_list(lower.tail(days)),
+        "mid": _finite_list(mid.tail(days)),
+        "upper": _finite_list(upper.tail(days)),
+    }
+
+    return result
+
+
 # =============================================================================
 # Analysis Tools
 # =============================================================================
@@ -423,6 +569,7 @@ def run_analysis(
         end=end_date,
         benchmark=benchmark,
     )
+    _invalidate_tool_cache("get_cache_info")
     return {"report_path": str(report_path)}
 
 
@@ -447,6 +594,7 @@ def run_backtest(
         end=end_date,
         out_dir=out_dir,
     )
+    _invalidate_tool_cache("get_cache_info")
     return {"backtest_path": str(report_path)}
 
 
@@ -482,6 +630,7 @@ def create_watchlist(name: str, tickers: list[str]) -> Any:
         tickers: List of ticker symbols to include
     """
     do_watchlist_set(name, tickers)
+    _invalidate_tool_cache(*_CONFIG_TOOLS)
     return {"status": "success", "name": name, "tickers": tickers}
 
 
@@ -494,6 +643,7 @@ def delete_watchlist(name: str) -> Any:
         name: Watchlist name to delete
     """
     do_watchlist_remove(name)
+    _invalidate_tool_cache(*_CONFIG_TOOLS)
     return {"status": "success", "deleted": name}
 
 
@@ -518,6 +668,7 @@ def analyze_watchlist(
         start=start_date,
         end=end_date,
     )
+    _invalidate_tool_cache("get_cache_info")
     return {
         "report_path": str(artifacts.report_path),
         "json_path": str(artifacts.json_path) if artifacts.json_path else None,
@@ -554,6 +705,7 @@ def add_portfolio_position(
         purchase_date=purchase_date,
         notes=notes,
     )
+    _invalidate_tool_cache(*_PORTFOLIO_TOOLS)
     return _serialize(result)
 
 
@@ -568,28 +720,29 @@ def remove_portfolio_position(ticker: str, shares: float, sale_price: float) ->
         sale_price: Sale price per share
     """
     do_portfolio_remove(ticker, shares, sale_price)
+    _invalidate_tool_cache(*_PORTFOLIO_TOOLS)
     return {"status": "success", "ticker": ticker, "shares_sold": shares}
 
 
 @mcp.tool()
+@_ttl_cache(seconds=5)
 def get_portfolio() -> Any:
     """Get current portfolio positions with current prices and P&L."""
-    result = do_portfolio_show(include_total=True)
-    return _serialize(result)
+    # do_portfolio_* results are plain Python values already; skip the _serialize walk.
+    return do_portfolio_show(include_total=True)
 
 
 @mcp.tool()
+@_ttl_cache(seconds=5)
 def get_portfolio_allocation() -> Any:
     """Get portfolio allocation percentages by position."""
-    result = do_portfolio_allocation()
-    return _serialize(result)
+    return do_portfolio_allocation()
 
 
 @mcp.tool()
 def get_portfolio_history() -> Any:
     """Get portfolio transaction history."""
-    result = do_portfolio_history()
-    return {"transactions": _serialize(result)}
+    return {"transactions": do_portfolio_history()}
 
 
 # =============================================================================
@@ -607,6 +760,7 @@ def paper_buy(ticker: str, shares: float) -> Any:
         shares: Number of shares to buy
     """
     result = do_paper_buy(ticker, shares)
+    _invalidate_tool_cache(*_PORTFOLIO_TOOLS)
     return _serialize(result)
 
 
@@ -620,17 +774,19 @@ def paper_sell(ticker: str, shares: float) -> Any:
         shares: Number of shares to sell
     """
     result = do_paper_sell(ticker, shares)
+    _invalidate_tool_cache(*_PORTFOLIO_TOOLS)
     return _serialize(result)
 
 
 @mcp.tool()
+@_ttl_cache(seconds=5)
 def get_paper_status() -> Any:
     """Get paper trading portfolio status with P&L summary."""
-    result = do_paper_status()
-    return _serialize(result)
+    return do_paper_status()
 
 
 @mcp.tool()
+@_ttl_cache(seconds=5)
 def get_paper_leaderboard() -> Any:
     """Get paper trading performance metrics for leaderboard."""
     result = do_paper_leaderboard()
@@ -699,6 +855,7 @@ def fetch_data(tickers: list[str] | None = None) -> Any:
         tickers: List of ticker symbols (uses config default if not provided)
     """
     result = do_data_fetch(tickers)
+    _invalidate_tool_cache("get_cache_info")
     return _serialize(result)
 
 
@@ -716,6 +873,7 @@ def verify_data(tickers: list[str] | None = None) -> Any:
 
 
 @mcp.tool()
+@_ttl_cache(seconds=30)
 def get_cache_info() -> Any:
     """Get information about the data cache (size, entries, etc)."""
     result = do_data_cache_info()
@@ -738,6 +896,7 @@ def get_config() -> Any:
 def validate_config() -> Any:
     """Validate the current configuration file."""
     result = do_config_validate()
+    _invalidate_tool_cache(*_CONFIG_TOOLS)
     return _serialize(result)
 
 
@@ -749,8 +908,8 @@ def validate_config() -> Any:
 @mcp.tool()
 def get_latest_report() -> Any:
     """Get the most recent analysis report."""
-    result = do_report_latest(include_json=True)
-    return _serialize(result)
+    # Already a flat dict of path strings; pass it through untouched.
+    return do_report_latest(include_json=True)
 
 
 @mcp.tool()
@@ -761,8 +920,8 @@ def view_report(path: str | None = None) -> Any:
     Args:
         path: Path to report file (uses latest if not provided)
     """
-    result = do_report_view(Path(path) if path else None)
-    return _serialize(result)
+    # The report text is returned as read from disk, without a serialize pass.
+    return do_report_view(Path(path) if path else None)
 
 
 @mcp.tool()
@@ -773,8 +932,8 @@ def list_history(limit: int = 20) -> Any:
     Args:
         limit: Maximum number of history entries to return (default: 20)
     """
-    result = do_history_list(limit=limit)
-    return {"history": _serialize(result)}
+    # Serialize records as they are read rather than building the full list first.
+    return {"history": [_serialize(r) for r in do_history_iter(limit=limit)]}
 
 
 # =============================================================================
@@ -783,6 +942,7 @@ def list_history(limit: int = 20) -> Any:
 
 
 @mcp.tool()
+@_ttl_cache(seconds=30)
 def get_schedule_status() -> Any:
     """Get the current schedule status including next run time."""
     result = do_schedule_status()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
-from platformdirs import user_cache_dir, user_config_dir, user_state_dir
+from platformdirs import user_cache_dir, user_config_dir, user_data_dir, user_state_dir
 
 APP_NAME = "stonks-cli"
 
@@ -17,3 +18,11 @@ def default_state_dir() -> Path:
 
 def default_cache_dir() -> Path:
     return Path(user_cache_dir(APP_NAME))
+
+
+@cache
+def default_data_dir() -> Path:
+    """User data dir (portfolio, paper trading, alerts), created once per process."""
+    d = Path(user_data_dir(APP_NAME))
+    d.mkdir(parents=True, exist_ok=True)
+    return d
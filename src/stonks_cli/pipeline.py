@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from functools import partial
 from pathlib import Path
 from typing import Any
@@ -9,7 +15,7 @@ from rich.console import Console
 from rich.progress import Progress
 
 from stonks_cli.analysis.backtest import compute_backtest_metrics, walk_forward_backtest
-from stonks_cli.analysis.indicators import atr, bollinger_bands, rolling_volatility, rsi, sma
+from stonks_cli.analysis.indicators import bollinger_bands, last_atr, last_rolling_volatility, rsi, sma
 from stonks_cli.analysis.risk import (
     scale_fractions_to_portfolio_cap,
     suggest_position_fraction_by_volatility,
@@ -25,22 +31,115 @@ from stonks_cli.analysis.strategy import (
     sma_col,
     sma_cross_strategy,
 )
-from stonks_cli.config import AppConfig
+from stonks_cli.config import AppConfig, DataConfig
 from stonks_cli.data.providers import CsvProvider, PriceProvider, StooqProvider, YFinanceProvider, normalize_ticker
+from stonks_cli.errors import BadConfigError
 from stonks_cli.logging_utils import log_suppressed_exception, track_event
 from stonks_cli.plugins import registry_for_config
 from stonks_cli.reporting.csv_report import write_csv_summary
 from stonks_cli.reporting.report import TickerResult, write_text_report
 from stonks_cli.storage import save_last_run
 
-STRATEGIES = {
-    "basic_trend_rsi": basic_trend_rsi_strategy,
-    "sma_cross": sma_cross_strategy,
-    "mean_reversion_bb_rsi": mean_reversion_bb_rsi_strategy,
+
+@dataclass(frozen=True)
+class StrategySpec:
+    """Built-in strategy: its callable, accepted params and the indicator columns it reads."""
+
+    name: str
+    fn: Callable[..., Recommendation]
+    param_schema: dict[str, type]
+    indicator_builder: Callable[[Any, dict[str, Any], set[str]], dict[str, Any]]
+
+
+def _sma_cross_indicators(close, params: dict[str, Any], have: set[str]) -> dict[str, Any]:
+    cols: dict[str, Any] = {}
+    for window in (int(params.get("fast", 20)), int(params.get("slow", 50))):
+        if sma_col(window) not in have and sma_col(window) not in cols:
+            cols[sma_col(window)] = sma(close, window)
+    return cols
+
+
+def _basic_trend_rsi_indicators(close, params: dict[str, Any], have: set[str]) -> dict[str, Any]:
+    cols: dict[str, Any] = {}
+    for window in (int(params.get("sma_fast", 20)), int(params.get("sma_slow", 50))):
+        if sma_col(window) not in have and sma_col(window) not in cols:
+            cols[sma_col(window)] = sma(close, window)
+    rsi_window = int(params.get("rsi_window", 14))
+    if rsi_col(rsi_window) not in have:
+        cols[rsi_col(rsi_window)] = rsi(close, rsi_window)
+    return cols
+
+
+def _mean_reversion_bb_rsi_indicators(close, params: dict[str, Any], have: set[str]) -> dict[str, Any]:
+    cols: dict[str, Any] = {}
+    bb_window = int(params.get("bb_window", 20))
+    bb_num_std = float(params.get("bb_num_std", 2.0))
+    bb_names = bb_cols(bb_window, bb_num_std)
+    if not set(bb_names).issubset(have):
+        bands = bollinger_bands(close, window=bb_window, num_std=bb_num_std)
+        for name, band in zip(bb_names, bands, strict=True):
+            if name not in have:
+                cols[name] = band
+    rsi_window = int(params.get("rsi_window", 14))
+    if rsi_col(rsi_window) not in have:
+        cols[rsi_col(rsi_window)] = rsi(close, rsi_window)
+    return cols
+
+
+STRATEGY_SPECS: dict[str, StrategySpec] = {
+    "basic_trend_rsi": StrategySpec(
+        name="basic_trend_rsi",
+        fn=basic_trend_rsi_strategy,
+        param_schema={
+            "sma_fast": int,
+            "sma_slow": int,
+            "rsi_window": int,
+            "rsi_overbought": float,
+            "rsi_oversold": float,
+            "min_history_days": int,
+        },
+        indicator_builder=_basic_trend_rsi_indicators,
+    ),
+    "sma_cross": StrategySpec(
+        name="sma_cross",
+        fn=sma_cross_strategy,
+        param_schema={"fast": int, "slow": int},
+        indicator_builder=_sma_cross_indicators,
+    ),
+    "mean_reversion_bb_rsi": StrategySpec(
+        name="mean_reversion_bb_rsi",
+        fn=mean_reversion_bb_rsi_strategy,
+        param_schema={
+            "bb_window": int,
+            "bb_num_std": float,
+            "rsi_window": int,
+            "rsi_low": float,
+            "rsi_high": float,
+            "min_history_days": int,
+        },
+        indicator_builder=_mean_reversion_bb_rsi_indicators,
+    ),
 }
+STRATEGIES = {name: spec.fn for name, spec in STRATEGY_SPECS.items()}
+_SPEC_BY_FN = {spec.fn: spec for spec in STRATEGY_SPECS.values()}
+
+
+def _spec_and_params(strategy_fn) -> tuple[StrategySpec | None, dict[str, Any]]:
+    """Resolve a strategy callable to its built-in spec and bound params (None for plugins)."""
+
+    spec = _SPEC_BY_FN.get(strategy_fn)
+    if spec is not None:
+        return spec, {}
+    if isinstance(strategy_fn, partial):
+        spec = _SPEC_BY_FN.get(strategy_fn.func)
+        if spec is not None:
+            return spec, dict(strategy_fn.keywords or {})
+    return None, {}
 
 
 def select_strategy(cfg: AppConfig):
+    """Return the configured strategy as a ``strategy_fn(df) -> Recommendation`` callable."""
+
     plugins = registry_for_config(cfg)
     combined = {**STRATEGIES, **(plugins.strategies or {})}
     fn = combined.get(cfg.strategy, combined["basic_trend_rsi"])
@@ -50,50 +149,37 @@ def select_strategy(cfg: AppConfig):
     if not params:
         return fn
 
-    base_fn = fn
-    existing_kwargs: dict[str, Any] = {}
-    if isinstance(fn, partial):
-        base_fn = fn.func
-        existing_kwargs = dict(fn.keywords or {})
-
-    kwargs: dict[str, object] = {}
-    if base_fn is sma_cross_strategy:
-        if "fast" in params:
-            kwargs["fast"] = int(params["fast"])  # type: ignore[arg-type]
-        if "slow" in params:
-            kwargs["slow"] = int(params["slow"])  # type: ignore[arg-type]
-    elif base_fn is basic_trend_rsi_strategy:
-        for k in [
-            "sma_fast",
-            "sma_slow",
-            "rsi_window",
-            "rsi_overbought",
-            "rsi_oversold",
-            "min_history_days",
-        ]:
-            if k in params:
-                kwargs[k] = params[k]
-    elif base_fn is mean_reversion_bb_rsi_strategy:
-        for k in [
-            "bb_window",
-            "bb_num_std",
-            "rsi_window",
-            "rsi_low",
-            "rsi_high",
-            "min_history_days",
-        ]:
-            if k in params:
-                kwargs[k] = params[k]
+    spec, existing_kwargs = _spec_and_params(fn)
+    if spec is None:
+        return fn
 
+    kwargs: dict[str, Any] = {}
+    for k, cast in spec.param_schema.items():
+        if k not in params:
+            continue
+        try:
+            kwargs[k] = cast(params[k])
+        except (TypeError, ValueError, OverflowError) as e:
+            raise BadConfigError(
+                f"strategy_params.{k} for '{spec.name}' must be {cast.__name__}, got {params[k]!r}"
+            ) from e
     if not kwargs:
         return fn
-    return partial(base_fn, **{**existing_kwargs, **kwargs})
+    return partial(spec.fn, **{**existing_kwargs, **kwargs})
+
+
+def _data_config_for(cfg: AppConfig, ticker: str) -> DataConfig:
+    override = cfg.ticker_overrides.get(ticker)
+    return override.data if override else cfg.data
 
 
 def provider_for_config(cfg: AppConfig, ticker: str) -> PriceProvider:
-    t = normalize_ticker(ticker)
-    override = cfg.ticker_overrides.get(t)
-    data_cfg = override.data if override else cfg.data
+    return provider_for_normalized_ticker(cfg, normalize_ticker(ticker))
+
+
+def provider_for_normalized_ticker(cfg: AppConfig, t: str) -> PriceProvider:
+    """Like provider_for_config, for a ticker that has already been through normalize_ticker."""
+    data_cfg = _data_config_for(cfg, t)
     if data_cfg.provider == "csv":
         if not data_cfg.csv_path:
             raise ValueError(f"csv provider requires csv_path for {t}")
@@ -130,6 +216,181 @@ def provider_for_config(cfg: AppConfig, ticker: str) -> PriceProvider:
     return StooqProvider(cache_ttl_seconds=data_cfg.cache_ttl_seconds)
 
 
+def _analyze_one(
+    series,
+    cfg: AppConfig,
+    strategy_fn,
+    *,
+    start: str | None,
+    end: str | None,
+    benchmark_df,
+    benchmark_ticker: str | None,
+) -> tuple[TickerResult, float | None, object | None]:
+    """Analyze one fetched series.
+
+    Returns the ticker result, its volatility-sized fraction (if any) and its
+    backtest equity curve (if non-empty).
+    """
+    df = series.df
+    if start:
+        df = df.loc[start:]
+    if end:
+        df = df.loc[:end]
+
+    df = _prepare_df_for_strategy(df, strategy_fn)
+
+    rows_used = int(len(df))
+    last_date = None
+    if not df.empty:
+        try:
+            last_idx = df.index[-1]
+            # Prefer ISO date for Timestamp-like index.
+            last_date = getattr(last_idx, "date", lambda: last_idx)()
+            last_date = str(last_date)
+        except Exception as e:
+            log_suppressed_exception(
+                context="pipeline.compute_results.last_date",
+                error=e,
+                ticker=series.ticker,
+            )
+            last_date = None
+    expected_cols = {"close", "open", "high", "low", "volume"}
+    missing_columns = sorted(expected_cols - set(df.columns))
+    last_close = None
+    suggested_position_fraction: float | None = None
+    fraction: float | None = None
+    vol_annualized: float | None = None
+    atr14: float | None = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
+    if "close" in df.columns and not df.empty:
+        last_close = float(df["close"].iloc[-1])
+    if len(df) < cfg.risk.min_history_days:
+        strat_rec = Recommendation(
+            action="INSUFFICIENT_HISTORY",
+            confidence=0.1,
+            rationale=f"Need >={cfg.risk.min_history_days} rows",
+        )
+    else:
+        strat_rec = strategy_fn(df)
+    # Adjust action/confidence and collect rationale fragments; the final
+    # Recommendation is built once below.
+    action = strat_rec.action
+    confidence = strat_rec.confidence
+    fragments = [strat_rec.rationale]
+    if "volume" not in df.columns or df.empty:
+        if action in {"BUY_DCA", "HOLD_DCA"}:
+            action = "HOLD_WAIT"
+            confidence = min(0.4, confidence)
+            fragments.append("volume missing; avoid new buys")
+    else:
+        try:
+            v_last = float(df["volume"].iloc[-1])
+        except Exception as e:
+            log_suppressed_exception(
+                context="pipeline.compute_results.latest_volume",
+                error=e,
+                ticker=series.ticker,
+            )
+            v_last = 0.0
+        if v_last <= 0 and action in {"BUY_DCA", "HOLD_DCA"}:
+            action = "HOLD_WAIT"
+            confidence = min(0.4, confidence)
+            fragments.append("volume insufficient; avoid new buys")
+    if "close" in df.columns and not df.empty:
+        # Only the latest value is needed, so read it from the trailing window; NaN (window
+        # not filled) just fails isfinite.
+        vol_f = last_rolling_volatility(df["close"], window=20)
+        if math.isfinite(vol_f):
+            vol_annualized = vol_f
+        pos = suggest_position_fraction_by_volatility(
+            vol_f,
+            max_fraction=cfg.risk.max_position_fraction,
+        )
+        if pos is not None:
+            suggested_position_fraction = float(pos)
+            fraction = pos
+            fragments.append(
+                f"sizing~{pos * 100:.0f}% (ann vol {vol_f * 100:.0f}%, cap {cfg.risk.max_position_fraction * 100:.0f}%)"
+            )
+
+    if {"high", "low", "close"}.issubset(set(df.columns)) and not df.empty:
+        last = float(df["close"].iloc[-1])
+        atr_f = last_atr(df["high"], df["low"], df["close"], window=14)
+        if math.isfinite(atr_f):
+            atr14 = atr_f
+        sl = suggest_stop_loss_price_by_atr(last, atr_f, multiple=2.0)
+        tp = suggest_take_profit_price_by_atr(last, atr_f, multiple=3.0)
+        if sl is not None:
+            stop_loss = float(sl)
+        if tp is not None:
+            take_profit = float(tp)
+        if sl is not None and tp is not None:
+            fragments.append(f"stop~{sl:.2f} (2.0x ATR14 {atr_f:.2f})")
+            fragments.append(f"take~{tp:.2f} (3.0x ATR14)")
+        elif sl is not None:
+            fragments.append(f"stop~{sl:.2f} (2.0x ATR14 {atr_f:.2f})")
+        elif tp is not None:
+            fragments.append(f"take~{tp:.2f} (3.0x ATR14 {atr_f:.2f})")
+
+    if len(fragments) == 1 and action == strat_rec.action and confidence == strat_rec.confidence:
+        rec = strat_rec
+    else:
+        rec = Recommendation(action=action, confidence=confidence, rationale=" | ".join(fragments))
+
+    bt = walk_forward_backtest(
+        df,
+        strategy_fn=strategy_fn,
+        min_history_rows=cfg.risk.min_history_days,
+        fee_bps=cfg.backtest.fee_bps,
+        slippage_bps=cfg.backtest.slippage_bps,
+    )
+    metrics = compute_backtest_metrics(bt.equity)
+    equity = bt.equity if bt.equity is not None and not bt.equity.empty else None
+
+    # Compute beta if benchmark data is available
+    beta_value = None
+    if benchmark_df is not None and "close" in df.columns:
+        from stonks_cli.analysis.correlation import compute_beta
+
+        ticker_df_for_beta = df.copy()
+        if "close" in ticker_df_for_beta.columns:
+            ticker_df_for_beta = ticker_df_for_beta.rename(columns={"close": "Close"})
+        beta_value = compute_beta(ticker_df_for_beta, benchmark_df, days=252)
+        if not math.isfinite(beta_value):
+            beta_value = None
+
+    result = TickerResult(
+        ticker=series.ticker,
+        last_close=last_close,
+        recommendation=rec,
+        backtest=metrics,
+        rows_used=rows_used,
+        last_date=last_date,
+        missing_columns=missing_columns,
+        suggested_position_fraction=suggested_position_fraction,
+        vol_annualized=vol_annualized,
+        atr14=atr14,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+        beta=beta_value,
+        benchmark=benchmark_ticker,
+    )
+    return result, fraction, equity
+
+
+def _analysis_processes() -> int:
+    """Worker processes for per-ticker analysis from STONKS_CLI_WORKERS (0/unset analyzes sequentially)."""
+    raw = os.getenv("STONKS_CLI_WORKERS", "").strip()
+    if not raw:
+        return 0
+    try:
+        n = int(raw)
+    except ValueError:
+        return 0
+    return min(n, os.cpu_count() or 1)
+
+
 def compute_results(
     cfg: AppConfig,
     console: Console,
@@ -140,25 +401,32 @@ def compute_results(
 ) -> tuple[list[TickerResult], object | None]:
     strategy_fn = select_strategy(cfg)
 
-    tickers = [normalize_ticker(t) for t in (cfg.tickers or [])]
+    # Normalize once and drop duplicates (keeping first-seen order) so each ticker is fetched once.
+    tickers = list(dict.fromkeys(normalize_ticker(t) for t in (cfg.tickers or [])))
     if cfg.deterministic:
         tickers = sorted(tickers)
     # Fetch in parallel to reduce wall-clock time for multiple tickers.
     series_by_ticker: dict[str, object] = {}
+    providers = providers_for_tickers(cfg, tickers)
+    batches, singles = _plan_fetches(cfg, tickers, providers)
 
-    def _fetch(t: str):
-        provider = provider_for_config(cfg, t)
-        return t, provider.fetch_daily(t)
+    def _fetch(provider: PriceProvider, t: str):
+        return [(t, provider.fetch_daily(t))]
+
+    def _fetch_batch(provider: PriceProvider, group: list[str]):
+        by_ticker = provider.fetch_daily_batch(group)
+        return [(t, by_ticker[t]) for t in group]
 
     with Progress(transient=True, console=console) as progress:
         task = progress.add_task("Fetching prices", total=len(tickers))
         max_workers = 1 if cfg.deterministic else min(cfg.data.concurrency_limit, max(1, len(tickers)))
         with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futs = [ex.submit(_fetch, t) for t in tickers]
+            futs = [ex.submit(_fetch_batch, provider, group) for provider, group in batches]
+            futs += [ex.submit(_fetch, provider, t) for provider, t in singles]
             for fut in as_completed(futs):
-                t, series = fut.result()
-                series_by_ticker[t] = series
-                progress.advance(task)
+                for t, series in fut.result():
+                    series_by_ticker[t] = series
+                    progress.advance(task)
 
     # Fetch benchmark data if specified
     benchmark_df = None
@@ -166,7 +434,7 @@ def compute_results(
     if benchmark:
         benchmark_ticker = normalize_ticker(benchmark)
         try:
-            provider = provider_for_config(cfg, benchmark_ticker)
+            provider = providers.get(benchmark_ticker) or provider_for_normalized_ticker(cfg, benchmark_ticker)
             benchmark_series = provider.fetch_daily(benchmark_ticker)
             benchmark_df = benchmark_series.df
             if start:
@@ -185,294 +453,137 @@ def compute_results(
     results: list[TickerResult] = []
     per_ticker_fraction: dict[str, float] = {}
     per_ticker_equity: dict[str, object] = {}
-    for ticker in tickers:
-        series = series_by_ticker[ticker]
-        df = series.df
-        if start:
-            df = df.loc[start:]
-        if end:
-            df = df.loc[:end]
-
-        df = _prepare_df_for_strategy(df, strategy_fn)
-
-        rows_used = int(len(df))
-        last_date = None
-        if not df.empty:
-            try:
-                last_idx = df.index[-1]
-                # Prefer ISO date for Timestamp-like index.
-                last_date = getattr(last_idx, "date", lambda: last_idx)()
-                last_date = str(last_date)
-            except Exception as e:
-                log_suppressed_exception(
-                    context="pipeline.compute_results.last_date",
-                    error=e,
-                    ticker=series.ticker,
-                )
-                last_date = None
-        expected_cols = {"close", "open", "high", "low", "volume"}
-        missing_columns = sorted(expected_cols - set(df.columns))
-        last_close = None
-        suggested_position_fraction: float | None = None
-        vol_annualized: float | None = None
-        atr14: float | None = None
-        stop_loss: float | None = None
-        take_profit: float | None = None
-        if "close" in df.columns and not df.empty:
-            last_close = float(df["close"].iloc[-1])
-        if len(df) < cfg.risk.min_history_days:
-            rec = Recommendation(
-                action="INSUFFICIENT_HISTORY",
-                confidence=0.1,
-                rationale=f"Need >={cfg.risk.min_history_days} rows",
-            )
-        else:
-            rec = strategy_fn(df)
-        if "volume" not in df.columns or df.empty:
-            if rec.action in {"BUY_DCA", "HOLD_DCA"}:
-                rec = Recommendation(
-                    action="HOLD_WAIT",
-                    confidence=min(0.4, rec.confidence),
-                    rationale=f"{rec.rationale} | volume missing; avoid new buys",
-                )
-        else:
-            try:
-                v_last = float(df["volume"].iloc[-1])
-            except Exception as e:
-                log_suppressed_exception(
-                    context="pipeline.compute_results.latest_volume",
-                    error=e,
-                    ticker=series.ticker,
-                )
-                v_last = 0.0
-            if v_last <= 0 and rec.action in {"BUY_DCA", "HOLD_DCA"}:
-                rec = Recommendation(
-                    action="HOLD_WAIT",
-                    confidence=min(0.4, rec.confidence),
-                    rationale=f"{rec.rationale} | volume insufficient; avoid new buys",
-                )
-        if "close" in df.columns and not df.empty:
-            vol = rolling_volatility(df["close"], window=20).iloc[-1]
-            try:
-                vol_f = float(vol)
-            except Exception as e:
-                log_suppressed_exception(
-                    context="pipeline.compute_results.rolling_volatility",
-                    error=e,
-                    ticker=series.ticker,
-                )
-                vol_f = float("nan")
-            if vol_f == vol_f:
-                vol_annualized = vol_f
-            pos = suggest_position_fraction_by_volatility(
-                vol_f,
-                max_fraction=cfg.risk.max_position_fraction,
-            )
-            if pos is not None:
-                suggested_position_fraction = float(pos)
-                per_ticker_fraction[series.ticker] = pos
-                rec = Recommendation(
-                    action=rec.action,
-                    confidence=rec.confidence,
-                    rationale=(
-                        f"{rec.rationale} | sizing~{pos * 100:.0f}% (ann vol {vol_f * 100:.0f}%, cap {cfg.risk.max_position_fraction * 100:.0f}%)"
-                    ),
-                )
-
-        if {"high", "low", "close"}.issubset(set(df.columns)) and not df.empty:
-            last = float(df["close"].iloc[-1])
-            atr14_s = atr(df["high"], df["low"], df["close"], window=14).iloc[-1]
-            try:
-                atr_f = float(atr14_s)
-            except Exception as e:
-                log_suppressed_exception(context="pipeline.compute_results.atr14", error=e, ticker=series.ticker)
-                atr_f = float("nan")
-            if atr_f == atr_f:
-                atr14 = atr_f
-            sl = suggest_stop_loss_price_by_atr(last, atr_f, multiple=2.0)
-            tp = suggest_take_profit_price_by_atr(last, atr_f, multiple=3.0)
-            if sl is not None:
-                stop_loss = float(sl)
-            if tp is not None:
-                take_profit = float(tp)
-            if sl is not None and tp is not None:
-                rec = Recommendation(
-                    action=rec.action,
-                    confidence=rec.confidence,
-                    rationale=f"{rec.rationale} | stop~{sl:.2f} (2.0x ATR14 {atr_f:.2f}) | take~{tp:.2f} (3.0x ATR14)",
-                )
-            elif sl is not None:
-                rec = Recommendation(
-                    action=rec.action,
-                    confidence=rec.confidence,
-                    rationale=f"{rec.rationale} | stop~{sl:.2f} (2.0x ATR14 {atr_f:.2f})",
-                )
-            elif tp is not None:
-                rec = Recommendation(
-                    action=rec.action,
-                    confidence=rec.confidence,
-                    rationale=f"{rec.rationale} | take~{tp:.2f} (3.0x ATR14 {atr_f:.2f})",
-                )
-
-        bt = walk_forward_backtest(
-            df,
-            strategy_fn=strategy_fn,
-            min_history_rows=cfg.risk.min_history_days,
-            fee_bps=cfg.backtest.fee_bps,
-            slippage_bps=cfg.backtest.slippage_bps,
-        )
-        metrics = compute_backtest_metrics(bt.equity)
-        if bt.equity is not None and not bt.equity.empty:
-            per_ticker_equity[series.ticker] = bt.equity
-
-        # Compute beta if benchmark data is available
-        beta_value = None
-        if benchmark_df is not None and "close" in df.columns:
-            from stonks_cli.analysis.correlation import compute_beta
-
-            ticker_df_for_beta = df.copy()
-            if "close" in ticker_df_for_beta.columns:
-                ticker_df_for_beta = ticker_df_for_beta.rename(columns={"close": "Close"})
-            beta_value = compute_beta(ticker_df_for_beta, benchmark_df, days=252)
-            if beta_value != beta_value:  # Check for NaN
-                beta_value = None
-
-        results.append(
-            TickerResult(
-                ticker=series.ticker,
-                last_close=last_close,
-                recommendation=rec,
-                backtest=metrics,
-                rows_used=rows_used,
-                last_date=last_date,
-                missing_columns=missing_columns,
-                suggested_position_fraction=suggested_position_fraction,
-                vol_annualized=vol_annualized,
-                atr14=atr14,
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                beta=beta_value,
-                benchmark=benchmark_ticker,
-            )
-        )
+    analyze = partial(
+        _analyze_one,
+        cfg=cfg,
+        strategy_fn=strategy_fn,
+        start=start,
+        end=end,
+        benchmark_df=benchmark_df,
+        benchmark_ticker=benchmark_ticker,
+    )
+    fetched = [series_by_ticker[t] for t in tickers]
+    analyzed = None
+    processes = 1 if cfg.deterministic else min(_analysis_processes(), len(tickers))
+    if processes > 1:
+        # Indicator/backtest work is CPU-bound, so separate processes sidestep the GIL.
+        try:
+            # Checked up front so only a job that can't cross the process boundary (e.g. a plugin
+            # strategy defined in a closure) falls back; errors raised inside _analyze_one propagate.
+            pickle.dumps(analyze)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            log_suppressed_exception(context="pipeline.compute_results.pickle_job", error=e)
+            processes = 1
+    if processes > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as ex:
+                analyzed = list(ex.map(analyze, fetched))
+        except BrokenProcessPool as e:
+            log_suppressed_exception(context="pipeline.compute_results.process_pool", error=e)
+            analyzed = None
+    if analyzed is None:
+        # Sequential unless worker processes were asked for: plugin strategies and providers are not
+        # required to be thread-safe, so analysis never shares them across threads.
+        analyzed = [analyze(series) for series in fetched]
+    # Both paths yield in ticker order, so reports stay deterministic.
+    for result, fraction, equity in analyzed:
+        results.append(result)
+        if fraction is not None:
+            per_ticker_fraction[result.ticker] = fraction
+        if equity is not None:
+            per_ticker_equity[result.ticker] = equity
 
     scaled, factor = scale_fractions_to_portfolio_cap(
         per_ticker_fraction,
         max_portfolio_exposure_fraction=cfg.risk.max_portfolio_exposure_fraction,
     )
     if factor not in (0.0, 1.0):
-        new_results: list[TickerResult] = []
-        for r in results:
+        cap_pct = cfg.risk.max_portfolio_exposure_fraction * 100
+        # TickerResult is frozen: swap in a replaced copy only where a fraction was scaled.
+        for i, r in enumerate(results):
             frac = scaled.get(r.ticker)
             if frac is None:
-                new_results.append(r)
                 continue
-            rec = Recommendation(
-                action=r.recommendation.action,
-                confidence=r.recommendation.confidence,
-                rationale=(
-                    f"{r.recommendation.rationale} | portfolio_cap {cfg.risk.max_portfolio_exposure_fraction * 100:.0f}% (scaled x{factor:.2f}; now~{frac * 100:.0f}%)"
-                ),
-            )
-            new_results.append(
-                TickerResult(
-                    ticker=r.ticker,
-                    last_close=r.last_close,
-                    recommendation=rec,
-                    backtest=r.backtest,
-                    rows_used=r.rows_used,
-                    last_date=r.last_date,
-                    missing_columns=r.missing_columns,
-                    suggested_position_fraction=r.suggested_position_fraction,
-                    vol_annualized=r.vol_annualized,
-                    atr14=r.atr14,
-                    stop_loss=r.stop_loss,
-                    take_profit=r.take_profit,
-                    beta=r.beta,
-                    benchmark=r.benchmark,
-                )
-            )
-        results = new_results
+            cap_note = f"portfolio_cap {cap_pct:.0f}% (scaled x{factor:.2f}; now~{frac * 100:.0f}%)"
+            rationale = " | ".join((r.recommendation.rationale, cap_note))
+            results[i] = replace(r, recommendation=replace(r.recommendation, rationale=rationale))
 
     portfolio_metrics = None
     if per_ticker_equity:
+        import numpy as np
         import pandas as pd
 
-        rets = []
-        for eq in per_ticker_equity.values():
-            s = eq.pct_change().fillna(0.0)
-            rets.append(s)
-        if rets:
-            rets_df = pd.concat(rets, axis=1).fillna(0.0)
-            port_ret = rets_df.mean(axis=1)
-            port_equity = (1.0 + port_ret).cumprod()
-            portfolio_metrics = compute_backtest_metrics(port_equity)
+        equities = list(per_ticker_equity.values())
+        ref_index = equities[0].index
+        if all(eq.index is ref_index or eq.index.equals(ref_index) for eq in equities[1:]):
+            # Aligned curves (the common case): average returns column-wise without index joins.
+            arr = np.column_stack([eq.pct_change().fillna(0.0).to_numpy(dtype=float) for eq in equities])
+            port_equity = pd.Series(np.cumprod(1.0 + arr.mean(axis=1)), index=ref_index)
+        else:
+            rets_df = pd.concat([eq.pct_change().fillna(0.0) for eq in equities], axis=1).fillna(0.0)
+            port_equity = (1.0 + rets_df.mean(axis=1)).cumprod()
+        portfolio_metrics = compute_backtest_metrics(port_equity)
 
     return results, portfolio_metrics
 
 
+def providers_for_tickers(cfg: AppConfig, tickers: list[str]) -> dict[str, PriceProvider]:
+    """Resolve a provider per ticker, sharing one instance across tickers with the same data config.
+
+    Plugin factories are called with the ticker, so they still get one call per ticker.
+    """
+
+    shared: dict[str, PriceProvider] = {}
+    out: dict[str, PriceProvider] = {}
+    for t in tickers:
+        nt = normalize_ticker(t)
+        data_cfg = _data_config_for(cfg, nt)
+        if data_cfg.provider == "plugin":
+            out[t] = provider_for_normalized_ticker(cfg, nt)
+            continue
+        key = data_cfg.model_dump_json()
+        if key not in shared:
+            shared[key] = provider_for_normalized_ticker(cfg, nt)
+        out[t] = shared[key]
+    return out
+
+
+def _plan_fetches(
+    cfg: AppConfig, tickers: list[str], providers: dict[str, PriceProvider]
+) -> tuple[list[tuple[PriceProvider, list[str]]], list[tuple[PriceProvider, str]]]:
+    """Split tickers into batch requests for providers that support them and per-ticker fetches."""
+
+    if cfg.deterministic:
+        return [], [(providers[t], t) for t in tickers]
+
+    groups: dict[int, tuple[PriceProvider, list[str]]] = {}
+    for t in tickers:
+        provider = providers[t]
+        groups.setdefault(id(provider), (provider, []))[1].append(t)
+
+    batches: list[tuple[PriceProvider, list[str]]] = []
+    singles: list[tuple[PriceProvider, str]] = []
+    for provider, group in groups.values():
+        if len(group) > 1 and getattr(provider, "supports_batch", False):
+            batches.append((provider, group))
+        else:
+            singles.extend((provider, t) for t in group)
+    return batches, singles
+
+
 def _prepare_df_for_strategy(df, strategy_fn):
     """Attach commonly-used indicator columns once, reused by strategy and backtest."""
 
-    if df is None or getattr(df, "empty", True) or "close" not in df.columns:
+    # Resolve the spec first so plugin strategies return before touching the frame.
+    spec, params = _spec_and_params(strategy_fn)
+    if spec is None:
         return df
-
-    base_fn = strategy_fn
-    kwargs = {}
-    if isinstance(strategy_fn, partial):
-        base_fn = strategy_fn.func
-        kwargs = dict(strategy_fn.keywords or {})
-
-    if base_fn not in (basic_trend_rsi_strategy, sma_cross_strategy, mean_reversion_bb_rsi_strategy):
+    if df is None or getattr(df, "empty", True) or "close" not in df.columns:
         return df
 
-    close = df["close"].astype(float)
-    out = df.copy()
-
-    if base_fn is sma_cross_strategy:
-        fast = int(kwargs.get("fast", 20))
-        slow = int(kwargs.get("slow", 50))
-        c_fast = sma_col(fast)
-        c_slow = sma_col(slow)
-        if c_fast not in out.columns:
-            out[c_fast] = sma(close, fast)
-        if c_slow not in out.columns:
-            out[c_slow] = sma(close, slow)
-        return out
-
-    if base_fn is basic_trend_rsi_strategy:
-        sma_fast = int(kwargs.get("sma_fast", 20))
-        sma_slow = int(kwargs.get("sma_slow", 50))
-        rsi_window = int(kwargs.get("rsi_window", 14))
-        c_fast = sma_col(sma_fast)
-        c_slow = sma_col(sma_slow)
-        c_rsi = rsi_col(rsi_window)
-        if c_fast not in out.columns:
-            out[c_fast] = sma(close, sma_fast)
-        if c_slow not in out.columns:
-            out[c_slow] = sma(close, sma_slow)
-        if c_rsi not in out.columns:
-            out[c_rsi] = rsi(close, rsi_window)
-        return out
-
-    # mean_reversion_bb_rsi_strategy
-    bb_window = int(kwargs.get("bb_window", 20))
-    bb_num_std = float(kwargs.get("bb_num_std", 2.0))
-    rsi_window = int(kwargs.get("rsi_window", 14))
-    lo_c, mid_c, up_c = bb_cols(bb_window, bb_num_std)
-    need_bb = not {lo_c, mid_c, up_c}.issubset(set(out.columns))
-    if need_bb:
-        lower, mid, upper = bollinger_bands(close, window=bb_window, num_std=bb_num_std)
-        if lo_c not in out.columns:
-            out[lo_c] = lower
-        if mid_c not in out.columns:
-            out[mid_c] = mid
-        if up_c not in out.columns:
-            out[up_c] = upper
-    c_rsi = rsi_col(rsi_window)
-    if c_rsi not in out.columns:
-        out[c_rsi] = rsi(close, rsi_window)
-    return out
+    cols = spec.indicator_builder(df["close"].astype(float), params, set(df.columns))
+    # One assign adds every missing column in a single copy; the caller's frame is left untouched.
+    return df.assign(**cols) if cols else df
 
 
 def run_once(
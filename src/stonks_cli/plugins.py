@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
+import sys
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from functools import lru_cache
@@ -40,6 +43,13 @@ class PluginLoadSummary:
     errors: dict[str, str]
 
 
+# File plugins keyed by resolved path, holding (mtime in ns, module): re-executed only when the file
+# changes, which replaces the entry. Least recently used paths are dropped past the cap.
+# Import-path plugins are cached by sys.modules already.
+_MODULE_CACHE: OrderedDict[str, tuple[int, ModuleType]] = OrderedDict()
+_MODULE_CACHE_MAX = 64
+
+
 def _load_module(spec: str) -> ModuleType:
     s = (spec or "").strip()
     if not s:
@@ -50,40 +60,64 @@ def _load_module(spec: str) -> ModuleType:
         path = Path(s).expanduser()
         if not path.exists():
             raise FileNotFoundError(f"plugin file not found: {path}")
-        mod_name = f"stonks_plugin_{path.stem}_{abs(hash(str(path)))}"
+        resolved = path.resolve()
+        key = str(resolved)
+        mtime_ns = resolved.stat().st_mtime_ns
+        cached = _MODULE_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            _MODULE_CACHE.move_to_end(key)
+            return cached[1]
+        # Stable across processes (unlike hash()), so the module name is the same on every run.
+        digest = hashlib.blake2b(str(resolved).encode("utf-8"), digest_size=8).hexdigest()
+        mod_name = f"stonks_plugin_{path.stem}_{digest}"
         module_spec = importlib.util.spec_from_file_location(mod_name, str(path))
         if module_spec is None or module_spec.loader is None:
             raise ImportError(f"failed to load plugin module from {path}")
         module = importlib.util.module_from_spec(module_spec)
-        module_spec.loader.exec_module(module)  # type: ignore[union-attr]
+        # Register under the stable name (importlib's recipe) so the module is findable
+        # via sys.modules, e.g. by dataclasses or pickle inside the plugin.
+        sys.modules[mod_name] = module
+        try:
+            module_spec.loader.exec_module(module)  # type: ignore[union-attr]
+        except BaseException:
+            sys.modules.pop(mod_name, None)
+            raise
+        _MODULE_CACHE[key] = (mtime_ns, module)
+        _MODULE_CACHE.move_to_end(key)
+        while len(_MODULE_CACHE) > _MODULE_CACHE_MAX:
+            _MODULE_CACHE.popitem(last=False)
         return module
 
     return importlib.import_module(s)
 
 
+def _scan_module(
+    module: ModuleType,
+    spec: str,
+    strategies: dict[str, StrategyFn],
+    provider_factories: dict[str, ProviderFactory],
+) -> None:
+    """Collect a plugin module's STONKS_STRATEGIES / STONKS_PROVIDER_FACTORIES entries."""
+    mod_strats = getattr(module, "STONKS_STRATEGIES", None)
+    if isinstance(mod_strats, dict):
+        for name, fn in mod_strats.items():
+            if isinstance(name, str) and name.strip() and callable(fn):
+                strategies[name] = _validated_strategy(spec, name, fn)
+
+    mod_providers = getattr(module, "STONKS_PROVIDER_FACTORIES", None)
+    if isinstance(mod_providers, dict):
+        for name, factory in mod_providers.items():
+            if isinstance(name, str) and name.strip() and callable(factory):
+                provider_factories[name] = factory
+
+
 @lru_cache(maxsize=64)
 def load_plugins(plugin_specs: tuple[str, ...]) -> PluginRegistry:
     strategies: dict[str, StrategyFn] = {}
     provider_factories: dict[str, ProviderFactory] = {}
 
     for spec in plugin_specs:
-        module = _load_module(spec)
-
-        mod_strats = getattr(module, "STONKS_STRATEGIES", None)
-        if isinstance(mod_strats, dict):
-            for name, fn in mod_strats.items():
-                if not isinstance(name, str) or not name.strip():
-                    continue
-                if callable(fn):
-                    strategies[name] = _validated_strategy(spec, name, fn)
-
-        mod_providers = getattr(module, "STONKS_PROVIDER_FACTORIES", None)
-        if isinstance(mod_providers, dict):
-            for name, factory in mod_providers.items():
-                if not isinstance(name, str) or not name.strip():
-                    continue
-                if callable(factory):
-                    provider_factories[name] = factory
+        _scan_module(_load_module(spec), spec, strategies, provider_factories)
 
     return PluginRegistry(strategies=strategies, provider_factories=provider_factories)
 
@@ -101,22 +135,7 @@ def load_plugins_best_effort(plugin_specs: tuple[str, ...]) -> PluginLoadSummary
         except Exception as e:
             errors[spec] = str(e)
             continue
-
-        mod_strats = getattr(module, "STONKS_STRATEGIES", None)
-        if isinstance(mod_strats, dict):
-            for name, fn in mod_strats.items():
-                if not isinstance(name, str) or not name.strip():
-                    continue
-                if callable(fn):
-                    strategies[name] = _validated_strategy(spec, name, fn)
-
-        mod_providers = getattr(module, "STONKS_PROVIDER_FACTORIES", None)
-        if isinstance(mod_providers, dict):
-            for name, factory in mod_providers.items():
-                if not isinstance(name, str) or not name.strip():
-                    continue
-                if callable(factory):
-                    provider_factories[name] = factory
+        _scan_module(module, spec, strategies, provider_factories)
 
     return PluginLoadSummary(
         registry=PluginRegistry(strategies=strategies, provider_factories=provider_factories),
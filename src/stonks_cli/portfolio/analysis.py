@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from stonks_cli.portfolio.models import Portfolio
 
 
@@ -14,28 +16,78 @@ def calculate_portfolio_allocation(portfolio: Portfolio, prices: dict[str, float
         Dict mapping ticker to percentage of total portfolio value.
     """
     allocations: dict[str, float] = {}
-    total_value = 0.0
+    positions = portfolio.positions
+    n = len(positions)
 
-    # Calculate market value for each position
-    position_values: dict[str, float] = {}
-    for pos in portfolio.positions:
-        price = prices.get(pos.ticker, 0.0)
-        market_value = pos.shares * price
-        position_values[pos.ticker] = position_values.get(pos.ticker, 0.0) + market_value
-        total_value += market_value
+    # Market value per position, then summed per ticker (first-seen order) in one bincount.
+    order: dict[str, int] = {}
+    inv = np.fromiter((order.setdefault(p.ticker, len(order)) for p in positions), dtype=np.intp, count=n)
+    shares = np.fromiter((p.shares for p in positions), dtype=np.float64, count=n)
+    px = np.fromiter((prices.get(p.ticker, 0.0) for p in positions), dtype=np.float64, count=n)
+    position_values = np.bincount(inv, weights=shares * px, minlength=len(order))
 
     # Include cash in total value
-    total_value += portfolio.cash_balance
+    total_value = float(position_values.sum()) + portfolio.cash_balance
 
     if total_value == 0:
         return allocations
 
     # Calculate percentages
-    for ticker, value in position_values.items():
-        allocations[ticker] = (value / total_value) * 100
+    pct = position_values * (100.0 / total_value)
+    allocations = dict(zip(order, pct.tolist(), strict=True))
 
     # Add cash allocation if present
     if portfolio.cash_balance > 0:
         allocations["CASH"] = (portfolio.cash_balance / total_value) * 100
 
     return allocations
+
+
+def _fifo_cut(lot_shares: np.ndarray, lot_cost: np.ndarray, qty: float) -> tuple[float, int, float]:
+    """Cost basis of selling ``qty`` from FIFO-ordered lots.
+
+    Returns ``(cost_basis, k, partial)``: lots ``[0, k)`` are sold entirely and
+    ``partial`` shares come out of lot ``k``. Pure array code, no Python per-lot loop.
+    """
+    cum = np.cumsum(lot_shares)
+    k = int(np.searchsorted(cum, qty, side="right"))
+    cost_basis = float(np.dot(lot_shares[:k], lot_cost[:k]))
+    partial = qty - (float(cum[k - 1]) if k else 0.0)
+    if k < len(lot_shares) and partial > 0:
+        cost_basis += partial * float(lot_cost[k])
+    else:
+        partial = 0.0
+    return cost_basis, k, partial
+
+
+def sell_fifo(portfolio: Portfolio, ticker: str, shares: float) -> float:
+    """Remove ``shares`` of ``ticker`` from the oldest lots first; return the cost basis sold.
+
+    Mutates ``portfolio.positions`` in place.
+    """
+    positions = portfolio.positions
+    idx = [i for i, p in enumerate(positions) if p.ticker == ticker]
+    if not idx:
+        raise ValueError(f"No position found for {ticker}")
+
+    n = len(idx)
+    lot_shares = np.fromiter((positions[i].shares for i in idx), dtype=np.float64, count=n)
+    lot_cost = np.fromiter((positions[i].cost_basis_per_share for i in idx), dtype=np.float64, count=n)
+    ordinals = np.fromiter((positions[i].purchase_date.toordinal() for i in idx), dtype=np.int64, count=n)
+
+    total_shares_available = float(lot_shares.sum())
+    if total_shares_available < shares:
+        raise ValueError(f"Insufficient shares. Have {total_shares_available}, trying to sell {shares}")
+
+    # FIFO order by purchase date (stable, so same-day lots keep insertion order)
+    order = np.argsort(ordinals, kind="stable")
+    lots = [idx[j] for j in order.tolist()]
+    total_cost_basis, k, partial = _fifo_cut(lot_shares[order], lot_cost[order], shares)
+
+    if partial:
+        positions[lots[k]].shares -= partial
+    if k:
+        sold = set(lots[:k])
+        positions[:] = [p for i, p in enumerate(positions) if i not in sold]
+
+    return total_cost_basis
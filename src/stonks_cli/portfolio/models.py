@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a single stock position in a portfolio."""
 
@@ -34,7 +34,7 @@ class Position:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """Represents a user's portfolio containing positions and cash."""
 
@@ -1,25 +1,32 @@
 from __future__ import annotations
 
 import json
+import math
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
-import platformdirs
-
+from stonks_cli.io_utils import append_jsonl, write_json_atomic
 from stonks_cli.logging_utils import log_suppressed_exception
+from stonks_cli.portfolio.analysis import sell_fifo
 from stonks_cli.portfolio.models import Portfolio
 
 
+def _data_dir() -> Path:
+    from stonks_cli.paths import default_data_dir
+
+    return default_data_dir()
+
+
 def get_paper_portfolio_path() -> Path:
     """Get platform-appropriate path to paper_portfolio.json."""
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "paper_portfolio.json"
+    return _data_dir() / "paper_portfolio.json"
 
 
 def save_paper_portfolio(portfolio: Portfolio) -> None:
     """Save paper portfolio to disk."""
     path = get_paper_portfolio_path()
-    path.write_text(json.dumps(portfolio.to_dict(), indent=2), encoding="utf-8")
+    write_json_atomic(path, portfolio.to_dict())
 
 
 from datetime import date, datetime
@@ -32,15 +39,14 @@ def load_paper_portfolio() -> Portfolio:
         raise FileNotFoundError("Paper portfolio not initialized. Run 'stonks paper init' first.")
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
         return Portfolio.from_dict(data)
     except Exception:
         raise ValueError("Invalid paper portfolio file.")
 
 
 def get_paper_history_path() -> Path:
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    return data_dir / "paper_history.jsonl"
+    return _data_dir() / "paper_history.jsonl"
 
 
 def log_paper_transaction(action: str, ticker: str, shares: float, price: float, gain_loss: float = None) -> None:
@@ -55,8 +61,40 @@ def log_paper_transaction(action: str, ticker: str, shares: float, price: float,
     if gain_loss is not None:
         entry["gain_loss"] = gain_loss
 
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    append_jsonl(path, entry)
+
+
+def iter_paper_history(action: str) -> Iterator[dict]:
+    """Yield paper history records with the given action.
+
+    Lines that cannot mention the action are skipped before JSON parsing, so
+    replaying a long history only decodes the records that matter.
+    """
+    path = get_paper_history_path()
+    if not path.exists():
+        return
+    needle = json.dumps(action)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if needle not in line:
+                continue
+            try:
+                rec = json.loads(line)
+            except Exception as e:
+                log_suppressed_exception(
+                    context="portfolio.paper.iter_paper_history.parse_line",
+                    error=e,
+                    line=line.strip(),
+                )
+                continue
+            if rec.get("action") == action:
+                yield rec
+
+
+def paper_initial_cash(default: float = 10000.0) -> float:
+    """Total cash deposited by INIT records, or ``default`` when there are none."""
+    initial_cash = sum(rec.get("shares", 0.0) for rec in iter_paper_history("INIT"))
+    return initial_cash if initial_cash != 0 else default
 
 
 def paper_buy(ticker: str, shares: float, price: float) -> dict:
@@ -97,31 +135,11 @@ def paper_sell(ticker: str, shares: float, price: float) -> dict:
     portfolio = load_paper_portfolio()
     ticker_upper = ticker.upper()
 
-    positions = [p for p in portfolio.positions if p.ticker == ticker_upper]
-    positions.sort(key=lambda p: p.purchase_date)
-
-    total_avail = sum(p.shares for p in positions)
+    total_avail = sum(p.shares for p in portfolio.positions if p.ticker == ticker_upper)
     if total_avail < shares:
         raise ValueError(f"Insufficient shares. Have {total_avail}, trying to sell {shares}")
 
-    remaining = shares
-    total_cost_basis = 0.0
-    to_remove = []
-
-    for pos in positions:
-        if remaining <= 0:
-            break
-        if pos.shares <= remaining:
-            total_cost_basis += pos.shares * pos.cost_basis_per_share
-            remaining -= pos.shares
-            to_remove.append(pos)
-        else:
-            total_cost_basis += remaining * pos.cost_basis_per_share
-            pos.shares -= remaining
-            remaining = 0
-
-    for pos in to_remove:
-        portfolio.positions.remove(pos)
+    total_cost_basis = sell_fifo(portfolio, ticker_upper, shares)
 
     proceeds = shares * price
     portfolio.cash_balance += proceeds
@@ -151,80 +169,170 @@ def init_paper_portfolio(starting_cash: float = 10000.0) -> Portfolio:
     # Clear history
     path_hist = get_paper_history_path()
     path_hist.write_text("", encoding="utf-8")
+    _paper_stats_path().unlink(missing_ok=True)
 
     log_paper_transaction("INIT", "CASH", starting_cash, 1.0)
 
     return portfolio
 
 
+def reset_paper_portfolio() -> None:
+    """Delete the paper portfolio, its history and the cached performance aggregate."""
+    for path in (get_paper_portfolio_path(), get_paper_history_path(), _paper_stats_path()):
+        path.unlink(missing_ok=True)
+
+
+def _paper_stats_path() -> Path:
+    return get_paper_history_path().with_suffix(".agg.json")
+
+
+def _empty_trade_stats(initial_cash: float) -> dict:
+    return {
+        "initial_cash": initial_cash,
+        "head": "",
+        "offset": 0,
+        "last_ts": "",
+        "n": 0,
+        "wins": 0,
+        "best": None,
+        "worst": None,
+        "ret_n": 0,
+        "ret_mean": 0.0,
+        "ret_m2": 0.0,
+        "equity": initial_cash,
+        "peak": initial_cash,
+        "max_dd": 0.0,
+    }
+
+
+def _fold_trade(stats: dict, trade: dict) -> None:
+    gain = float(trade["gain_loss"])
+    stats["n"] += 1
+    if gain > 0:
+        stats["wins"] += 1
+    # Strict comparisons keep the first extreme on ties.
+    if stats["best"] is None or gain > stats["best"]["gain_loss"]:
+        stats["best"] = trade
+    if stats["worst"] is None or gain < stats["worst"]["gain_loss"]:
+        stats["worst"] = trade
+
+    cost = float(trade["shares"]) * float(trade["price"]) - gain
+    if cost > 0:
+        # Welford update of the per-trade return mean/variance.
+        ret = gain / cost
+        stats["ret_n"] += 1
+        delta = ret - stats["ret_mean"]
+        stats["ret_mean"] += delta / stats["ret_n"]
+        stats["ret_m2"] += delta * (ret - stats["ret_mean"])
+
+    stats["equity"] += gain
+    stats["peak"] = max(stats["peak"], stats["equity"])
+    if stats["peak"] > 0:
+        stats["max_dd"] = max(stats["max_dd"], (stats["peak"] - stats["equity"]) / stats["peak"])
+    stats["last_ts"] = trade["timestamp"]
+
+
+def _read_sell_trades(f, offset: int) -> tuple[list[dict], int]:
+    """Parse closed SELL trades from ``offset``, returning them and the offset past the last full line."""
+    f.seek(offset)
+    trades: list[dict] = []
+    for raw in f:
+        if not raw.endswith(b"\n"):
+            break  # Partially written line; pick it up next time.
+        offset += len(raw)
+        if b'"SELL"' not in raw:
+            continue
+        try:
+            rec = json.loads(raw)
+        except Exception as e:
+            log_suppressed_exception(
+                context="portfolio.paper.read_sell_trades.parse_line",
+                error=e,
+                line=raw.strip(),
+            )
+            continue
+        if rec.get("action") == "SELL" and rec.get("gain_loss") is not None:
+            trades.append(rec)
+    return trades, offset
+
+
+def _paper_trade_stats(initial_cash: float) -> dict:
+    """Closed-trade aggregates over paper_history.jsonl, updated incrementally.
+
+    Running totals and the byte offset they cover are cached next to the history, so
+    each call only parses trades appended since the last one. The cache is rebuilt from
+    scratch if the history was reset, the starting cash differs, or trades arrive out of
+    timestamp order.
+    """
+    path = get_paper_history_path()
+    stats_path = _paper_stats_path()
+    stats = _empty_trade_stats(initial_cash)
+    if not path.exists():
+        return stats
+
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head_raw = f.readline()
+        head = head_raw.decode("utf-8", errors="replace")
+        try:
+            cached = json.loads(stats_path.read_bytes())
+            if (
+                cached["initial_cash"] == initial_cash
+                and cached["head"] == head
+                and len(head_raw) <= cached["offset"] <= size
+            ):
+                stats = cached
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_suppressed_exception(context="portfolio.paper.trade_stats.load", error=e, path=stats_path)
+
+        start = stats["offset"]
+        new_trades, end = _read_sell_trades(f, start)
+        if end == start:
+            return stats
+        if any(t["timestamp"] < stats["last_ts"] for t in new_trades) or new_trades != sorted(
+            new_trades, key=lambda t: t["timestamp"]
+        ):
+            stats = _empty_trade_stats(initial_cash)
+            new_trades, end = _read_sell_trades(f, 0)
+            new_trades.sort(key=lambda t: t["timestamp"])
+
+    for trade in new_trades:
+        _fold_trade(stats, trade)
+    stats["head"] = head
+    stats["offset"] = end
+
+    try:
+        write_json_atomic(stats_path, stats)
+    except Exception as e:
+        log_suppressed_exception(context="portfolio.paper.trade_stats.save", error=e, path=stats_path)
+    return stats
+
+
 def calculate_paper_performance(
     portfolio: Portfolio,
     initial_cash: float,
     current_prices: dict[str, float] | None = None,
 ) -> dict:
     """Calculate performance metrics."""
-    path = get_paper_history_path()
-    trades = []
-    if path.exists():
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                    if rec.get("action") == "SELL" and rec.get("gain_loss") is not None:
-                        trades.append(rec)
-                except Exception as e:
-                    log_suppressed_exception(
-                        context="portfolio.paper.calculate_paper_performance.parse_history_line",
-                        error=e,
-                        line=line.strip(),
-                    )
-
-    # Metrics
-    num_trades = len(trades)
-    winning_trades = [t for t in trades if t["gain_loss"] > 0]
-    win_rate = (len(winning_trades) / num_trades * 100) if num_trades > 0 else 0.0
-
-    best_trade = max(trades, key=lambda t: t["gain_loss"]) if trades else None
-    worst_trade = min(trades, key=lambda t: t["gain_loss"]) if trades else None
-
-    # Sharpe & Max Drawdown (Approximate based on closed trades)
+    stats = _paper_trade_stats(initial_cash)
+
+    num_trades = stats["n"]
+    win_rate = stats["wins"] / num_trades * 100 if num_trades else 0.0
+    best_trade = stats["best"]
+    worst_trade = stats["worst"]
+
+    # Sharpe (Trade-based): Avg / StdDev of per-trade returns (not annualized)
     sharpe_ratio = 0.0
-    max_drawdown = 0.0
-
-    if trades:
-        import statistics
-
-        # Sharpe (Trade-based)
-        pct_returns = []
-        for t in trades:
-            proceeds = t["shares"] * t["price"]
-            gain = t["gain_loss"]
-            cost = proceeds - gain
-            if cost > 0:
-                pct_returns.append(gain / cost)
-
-        if len(pct_returns) > 1:
-            avg_ret = statistics.mean(pct_returns)
-            std_dev = statistics.stdev(pct_returns)
-            # Simple Sharpe: Avg / StdDev (not annualized)
-            sharpe_ratio = (avg_ret / std_dev) if std_dev > 0 else 0.0
-        elif len(pct_returns) == 1:
-            sharpe_ratio = pct_returns[0]  # Not really defined, but return value
-
-        # Max Drawdown (Realized Equity)
-        equity = initial_cash
-        peak = equity
-
-        # Sort trades by timestamp to be sure (though usually appended)
-        trades_sorted = sorted(trades, key=lambda x: x["timestamp"])
-
-        for t in trades_sorted:
-            equity += t["gain_loss"]
-            if equity > peak:
-                peak = equity
-            dd = (peak - equity) / peak if peak > 0 else 0.0
-            if dd > max_drawdown:
-                max_drawdown = dd
+    if stats["ret_n"] > 1:
+        std_dev = math.sqrt(stats["ret_m2"] / (stats["ret_n"] - 1))
+        sharpe_ratio = stats["ret_mean"] / std_dev if std_dev > 0 else 0.0
+    elif stats["ret_n"] == 1:
+        sharpe_ratio = stats["ret_mean"]  # Not really defined, but return value
+
+    # Max Drawdown (Realized Equity)
+    max_drawdown = stats["max_dd"]
 
     total_value = portfolio.cash_balance
     if current_prices:
@@ -1,46 +1,125 @@
 from __future__ import annotations
 
 import json
+import uuid
 from datetime import date, datetime
 from pathlib import Path
 
-import platformdirs
-
+from stonks_cli.io_utils import append_jsonl, write_json_atomic
+from stonks_cli.logging_utils import log_suppressed_exception
+from stonks_cli.portfolio.analysis import sell_fifo
 from stonks_cli.portfolio.models import Portfolio, Position
 
 
+def _data_dir() -> Path:
+    from stonks_cli.paths import default_data_dir
+
+    return default_data_dir()
+
+
 def get_portfolio_path() -> Path:
     """Get platform-appropriate path to portfolio.json."""
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "portfolio.json"
+    return _data_dir() / "portfolio.json"
 
 
 def get_history_path() -> Path:
     """Get platform-appropriate path to portfolio_history.jsonl."""
-    data_dir = Path(platformdirs.user_data_dir("stonks-cli"))
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "portfolio_history.jsonl"
+    return _data_dir() / "portfolio_history.jsonl"
+
+
+# Journal size past which the next write folds it back into portfolio.json.
+_JOURNAL_COMPACT_BYTES = 64 * 1024
+
+
+def get_journal_path() -> Path:
+    """Get platform-appropriate path to portfolio_journal.jsonl (pending position changes)."""
+    return _data_dir() / "portfolio_journal.jsonl"
 
 
 def load_portfolio() -> Portfolio:
-    """Load portfolio from disk, returning empty Portfolio if file doesn't exist."""
+    """Load portfolio from disk, returning empty Portfolio if file doesn't exist.
+
+    The snapshot in portfolio.json is combined with any changes journaled since it was written.
+    """
     path = get_portfolio_path()
-    if not path.exists():
-        return Portfolio()
+    portfolio = Portfolio()
+    applied = None
+    if path.exists():
+        try:
+            data = json.loads(path.read_bytes())
+            portfolio = Portfolio.from_dict(data)
+            applied = data.get("journal_applied")
+        except Exception:
+            portfolio = Portfolio()
 
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Portfolio.from_dict(data)
-    except Exception:
-        return Portfolio()
+    _replay_journal(portfolio, applied=applied)
+    return portfolio
 
 
 def save_portfolio(portfolio: Portfolio) -> None:
-    """Save portfolio to disk with updated timestamp."""
+    """Save portfolio to disk with updated timestamp.
+
+    The snapshot supersedes the journal, which is cleared. It records the journal's id first, so a
+    crash before the journal is removed cannot replay changes the snapshot already contains.
+    """
     portfolio.updated_at = datetime.now()
     path = get_portfolio_path()
-    path.write_text(json.dumps(portfolio.to_dict(), indent=2), encoding="utf-8")
+    journal = get_journal_path()
+    data = portfolio.to_dict()
+    journal_id = _journal_id(journal)
+    if journal_id is not None:
+        data["journal_applied"] = journal_id
+    write_json_atomic(path, data)
+    journal.unlink(missing_ok=True)
+
+
+def _journal_id(journal: Path) -> str | None:
+    """Id from the journal's "begin" header line, or None when absent (no journal, or a pre-header one)."""
+    try:
+        with journal.open("rb") as f:
+            head = json.loads(f.readline())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log_suppressed_exception(context="portfolio.journal_id", error=e, path=journal)
+        return None
+    if isinstance(head, dict) and head.get("op") == "begin":
+        return head.get("id")
+    return None
+
+
+def _replay_journal(portfolio: Portfolio, *, applied: str | None = None) -> None:
+    journal = get_journal_path()
+    if not journal.exists():
+        return
+    if applied is not None and _journal_id(journal) == applied:
+        # Left behind by a save that wrote the snapshot but died before removing the journal.
+        return
+    with journal.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry["op"] == "begin":
+                    continue
+                if entry["op"] == "add":
+                    portfolio.positions.append(Position.from_dict(entry["position"]))
+                elif entry["op"] == "remove":
+                    sell_fifo(portfolio, entry["ticker"], float(entry["shares"]))
+                portfolio.updated_at = datetime.fromisoformat(entry["at"])
+            except Exception as e:
+                log_suppressed_exception(context="portfolio.replay_journal", error=e, path=journal)
+
+
+def _append_journal(entry: dict) -> None:
+    """Record one position change without rewriting the whole portfolio."""
+    journal = get_journal_path()
+    if not journal.exists():
+        # A fresh id per journal lets the next snapshot record exactly which journal it folded in.
+        append_jsonl(journal, {"op": "begin", "id": uuid.uuid4().hex})
+    entry = {**entry, "at": datetime.now().isoformat()}
+    append_jsonl(journal, entry)
+    if journal.stat().st_size > _JOURNAL_COMPACT_BYTES:
+        save_portfolio(load_portfolio())
 
 
 def add_position(
@@ -51,8 +130,6 @@ def add_position(
     notes: str | None = None,
 ) -> Position:
     """Add a new position to the portfolio and save."""
-    portfolio = load_portfolio()
-
     position = Position(
         ticker=ticker.upper(),
         shares=shares,
@@ -61,8 +138,7 @@ def add_position(
         notes=notes,
     )
 
-    portfolio.positions.append(position)
-    save_portfolio(portfolio)
+    _append_journal({"op": "add", "position": position.to_dict()})
 
     # Log the transaction
     log_transaction("add", ticker, shares, cost_basis)
@@ -78,46 +154,14 @@ def remove_position(ticker: str, shares: float, sale_price: float) -> dict:
     portfolio = load_portfolio()
     ticker_upper = ticker.upper()
 
-    # Find positions for this ticker (FIFO order by purchase date)
-    ticker_positions = [p for p in portfolio.positions if p.ticker == ticker_upper]
-    ticker_positions.sort(key=lambda p: p.purchase_date)
-
-    if not ticker_positions:
-        raise ValueError(f"No position found for {ticker_upper}")
-
-    total_shares_available = sum(p.shares for p in ticker_positions)
-    if total_shares_available < shares:
-        raise ValueError(f"Insufficient shares. Have {total_shares_available}, trying to sell {shares}")
-
-    # Calculate realized gain/loss using FIFO
-    remaining_to_sell = shares
-    total_cost_basis = 0.0
-    positions_to_remove = []
-
-    for pos in ticker_positions:
-        if remaining_to_sell <= 0:
-            break
-
-        if pos.shares <= remaining_to_sell:
-            # Sell entire position
-            total_cost_basis += pos.shares * pos.cost_basis_per_share
-            remaining_to_sell -= pos.shares
-            positions_to_remove.append(pos)
-        else:
-            # Partial sell
-            total_cost_basis += remaining_to_sell * pos.cost_basis_per_share
-            pos.shares -= remaining_to_sell
-            remaining_to_sell = 0
-
-    # Remove fully sold positions
-    for pos in positions_to_remove:
-        portfolio.positions.remove(pos)
+    # Calculate realized gain/loss using FIFO (raises before anything is persisted)
+    total_cost_basis = sell_fifo(portfolio, ticker_upper, shares)
 
     proceeds = shares * sale_price
     realized_gain_loss = proceeds - total_cost_basis
     gain_loss_pct = (realized_gain_loss / total_cost_basis * 100) if total_cost_basis > 0 else 0.0
 
-    save_portfolio(portfolio)
+    _append_journal({"op": "remove", "ticker": ticker_upper, "shares": shares})
 
     # Log the transaction
     log_transaction("remove", ticker, shares, sale_price, gain_loss=realized_gain_loss)
@@ -153,5 +197,4 @@ def log_transaction(
     if gain_loss is not None:
         entry["gain_loss"] = gain_loss
 
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    append_jsonl(path, entry)
@@ -40,7 +40,7 @@ def write_backtest_report(rows: list[BacktestRow], out_dir: Path) -> Path:
             fmt(r.metrics.max_drawdown, pct=True),
         )
 
-    console = Console(record=True, width=120)
-    console.print(table)
-    path.write_text(console.export_text(), encoding="utf-8")
+    # Render straight into the file: no record buffer, nothing echoed to stdout.
+    with path.open("w", encoding="utf-8") as f:
+        Console(file=f, width=120, color_system=None, force_terminal=False).print(table)
     return path
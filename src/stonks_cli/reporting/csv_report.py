@@ -5,6 +5,12 @@ from pathlib import Path
 
 from stonks_cli.reporting.report import TickerResult
 
+_FIELDS = ("ticker", "action", "confidence", "cagr", "sharpe", "maxdd")
+
+
+def _fmt_metric(value: float | None) -> str:
+    return "" if value is None else f"{value:.6f}"
+
 
 def write_csv_summary(results: list[TickerResult], *, out_path: Path) -> Path:
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -26,24 +32,21 @@ def write_csv_summary(results: list[TickerResult], *, out_path: Path) -> Path:
             r.ticker,
         )
 
-    with out_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["ticker", "action", "confidence", "cagr", "sharpe", "maxdd"],
-            lineterminator="\n",
+    rows = [
+        (
+            r.ticker,
+            r.recommendation.action,
+            f"{r.recommendation.confidence:.4f}",
+            _fmt_metric(None if r.backtest is None else r.backtest.cagr),
+            _fmt_metric(None if r.backtest is None else r.backtest.sharpe),
+            _fmt_metric(None if r.backtest is None else r.backtest.max_drawdown),
         )
-        writer.writeheader()
-        for r in sorted(results, key=sort_key):
-            metrics = r.backtest
-            writer.writerow(
-                {
-                    "ticker": r.ticker,
-                    "action": r.recommendation.action,
-                    "confidence": f"{r.recommendation.confidence:.4f}",
-                    "cagr": "" if metrics is None or metrics.cagr is None else f"{metrics.cagr:.6f}",
-                    "sharpe": "" if metrics is None or metrics.sharpe is None else f"{metrics.sharpe:.6f}",
-                    "maxdd": "" if metrics is None or metrics.max_drawdown is None else f"{metrics.max_drawdown:.6f}",
-                }
-            )
+        for r in sorted(results, key=sort_key)
+    ]
+
+    with out_path.open("w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(_FIELDS)
+        writer.writerows(rows)
 
     return out_path
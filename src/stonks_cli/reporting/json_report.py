@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from stonks_cli.analysis.backtest import BacktestMetrics
+from stonks_cli.io_utils import write_json_atomic
 from stonks_cli.reporting.report import TickerResult
 
 
@@ -47,5 +47,6 @@ def write_json_report(
     }
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Swapped in whole, so readers never see a partial report.
+    write_json_atomic(out_path, payload)
     return out_path
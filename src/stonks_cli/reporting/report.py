@@ -11,7 +11,7 @@ from stonks_cli.analysis.backtest import BacktestMetrics
 from stonks_cli.analysis.strategy import Recommendation
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TickerResult:
     ticker: str
     last_close: float | None
@@ -37,13 +37,15 @@ def write_text_report(
     name: str | None = None,
 ) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
+    # One clock read serves both the filename stamp and the generated_at header.
+    now = datetime.now()
     if name:
         n = name
         if not n.lower().endswith(".txt"):
             n = f"{n}.txt"
         path = out_dir / n
     else:
-        ts = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        ts = now.strftime("%Y-%m-%d_%H%M%S")
         path = out_dir / f"report_{ts}.txt"
 
     # Check if any result has beta
@@ -83,14 +85,12 @@ def write_text_report(
     }
 
     def sort_key(r: TickerResult) -> tuple[int, float, str]:
-        return (
-            int(action_rank.get(r.recommendation.action, 50)),
-            -float(r.recommendation.confidence),
-            r.ticker,
-        )
+        return (action_rank.get(r.recommendation.action, 50), -r.recommendation.confidence, r.ticker)
 
+    add_row = table.add_row
     for r in sorted(results, key=sort_key):
-        last = "-" if r.last_close is None else f"{r.last_close:.2f}"
+        rec = r.recommendation
+        bt = r.backtest
         data_bits = []
         if r.rows_used is not None:
             data_bits.append(f"n={r.rows_used}")
@@ -98,55 +98,49 @@ def write_text_report(
             data_bits.append(f"last={r.last_date}")
         if r.missing_columns:
             data_bits.append("miss=" + ",".join(r.missing_columns))
-        data_summary = " ".join(data_bits) if data_bits else "-"
 
-        row_values = [
+        add_row(
             r.ticker,
-            last,
-            r.recommendation.action,
-            f"{r.recommendation.confidence:.2f}",
-        ]
-        if has_beta:
-            row_values.append(fmt(r.beta, pct=False))
-        row_values.extend(
-            [
-                fmt(r.backtest.cagr if r.backtest else None, pct=True),
-                fmt(r.backtest.sharpe if r.backtest else None, pct=False),
-                fmt(r.backtest.max_drawdown if r.backtest else None, pct=True),
-                data_summary,
-                r.recommendation.rationale,
-            ]
-        )
-        table.add_row(*row_values)
-
-    console = Console(record=True, width=120)
-    console.print("Stonks Report")
-    console.print(f"generated_at: {datetime.now().isoformat()}")
-    console.print(f"tickers: {len(results)}")
-
-    if portfolio is not None:
-        summary = Table(title="Portfolio Backtest")
-        summary.add_column("CAGR", justify="right")
-        summary.add_column("Sharpe", justify="right")
-        summary.add_column("MaxDD", justify="right")
-        summary.add_row(
-            fmt(portfolio.cagr, pct=True),
-            fmt(portfolio.sharpe, pct=False),
-            fmt(portfolio.max_drawdown, pct=True),
+            "-" if r.last_close is None else f"{r.last_close:.2f}",
+            rec.action,
+            f"{rec.confidence:.2f}",
+            *((fmt(r.beta),) if has_beta else ()),
+            fmt(bt.cagr if bt else None, pct=True),
+            fmt(bt.sharpe if bt else None),
+            fmt(bt.max_drawdown if bt else None, pct=True),
+            " ".join(data_bits) if data_bits else "-",
+            rec.rationale,
         )
-        console.print(summary)
 
-    console.print("")
-    console.print(table)
-
-    console.print("")
-    console.print("Risk Notes & Assumptions")
-    console.print("- This report is for informational purposes only; it is not financial advice.")
-    console.print("- Price data is sourced from the configured provider and may be delayed or incomplete.")
-    console.print(
-        "- Backtests are simplified and do not include fees, slippage, taxes, or dividends unless present in the data."
-    )
-    console.print("- Strategy signals and sizing are heuristic and may not generalize to future market conditions.")
+    # Render straight into the file: no record buffer, nothing echoed to stdout.
+    with path.open("w", encoding="utf-8") as f:
+        console = Console(file=f, width=120, color_system=None, force_terminal=False)
+        console.print("Stonks Report")
+        console.print(f"generated_at: {now.isoformat()}")
+        console.print(f"tickers: {len(results)}")
+
+        if portfolio is not None:
+            summary = Table(title="Portfolio Backtest")
+            summary.add_column("CAGR", justify="right")
+            summary.add_column("Sharpe", justify="right")
+            summary.add_column("MaxDD", justify="right")
+            summary.add_row(
+                fmt(portfolio.cagr, pct=True),
+                fmt(portfolio.sharpe, pct=False),
+                fmt(portfolio.max_drawdown, pct=True),
+            )
+            console.print(summary)
+
+        console.print("")
+        console.print(table)
+
+        console.print("")
+        console.print("Risk Notes & Assumptions")
+        console.print("- This report is for informational purposes only; it is not financial advice.")
+        console.print("- Price data is sourced from the configured provider and may be delayed or incomplete.")
+        console.print(
+            "- Backtests are simplified and do not include fees, slippage, taxes, or dividends unless present in the data."
+        )
+        console.print("- Strategy signals and sizing are heuristic and may not generalize to future market conditions.")
 
-    path.write_text(console.export_text(), encoding="utf-8")
     return path
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import atexit
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
 from stonks_cli.logging_utils import log_suppressed_exception
 
+# On Linux a live pid normally has a /proc entry; checked once so a missing procfs (some containers) skips the probe.
+_HAS_PROCFS = sys.platform.startswith("linux") and os.path.isdir("/proc/self")
+
 
 @dataclass(frozen=True)
 class PidFile:
@@ -22,6 +26,9 @@ class PidFile:
 def _pid_is_running(pid: int) -> bool:
     if pid <= 0:
         return False
+    # A /proc entry settles it; its absence doesn't, since hidepid mounts hide other users' processes.
+    if _HAS_PROCFS and os.path.isdir(f"/proc/{pid}"):
+        return True
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import signal
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -30,7 +31,7 @@ class SchedulerHandle:
             log_suppressed_exception(context="scheduler.handle.stop", error=e)
 
 
-def build_scheduler(
+def make_scheduler_job(
     cfg: AppConfig,
     out_dir: Path,
     console: Console | None = None,
@@ -38,19 +39,20 @@ def build_scheduler(
     report_name: str | None = None,
     csv_out: bool = False,
     sandbox: bool = False,
-) -> BlockingScheduler:
+) -> Callable[[], None]:
+    """Build the scheduled-run callable: one guarded run_once plus alert check, never raising."""
+
     console = console or Console()
     run_lock = Lock()
-    tz = resolve_timezone(cfg.schedule.timezone)
 
     def job() -> None:
         if not run_lock.acquire(blocking=False):
             console.print("[yellow]Scheduled run skipped[/yellow] previous run still active")
             return
-        started = datetime.now()
+        started_at = datetime.now().isoformat()
         t0 = perf_counter()
-        track_event("scheduler.job.started", started_at=started.isoformat())
-        console.print(f"[cyan]Scheduled run started[/cyan] {started.isoformat()}")
+        track_event("scheduler.job.started", started_at=started_at)
+        console.print(f"[cyan]Scheduled run started[/cyan] {started_at}")
         try:
             report_path = run_once(
                 cfg,
@@ -60,16 +62,16 @@ def build_scheduler(
                 csv_out=csv_out,
                 sandbox=sandbox,
             )
-            ended = datetime.now()
             dt_s = perf_counter() - t0
+            ended_at = datetime.now().isoformat()
             track_event(
                 "scheduler.job.finished",
-                started_at=started.isoformat(),
-                ended_at=ended.isoformat(),
+                started_at=started_at,
+                ended_at=ended_at,
                 duration_seconds=round(dt_s, 4),
                 report_path=report_path,
             )
-            console.print(f"[cyan]Scheduled run finished[/cyan] {ended.isoformat()} ({dt_s:.2f}s) report={report_path}")
+            console.print(f"[cyan]Scheduled run finished[/cyan] {ended_at} ({dt_s:.2f}s) report={report_path}")
 
             # Check alerts after analysis
             try:
@@ -86,18 +88,18 @@ def build_scheduler(
                 console.print(f"[yellow]Alert check failed:[/yellow] {alert_err}")
 
         except Exception as e:
-            ended = datetime.now()
             dt_s = perf_counter() - t0
+            ended_at = datetime.now().isoformat()
             track_event(
                 "scheduler.job.failed",
                 level=40,
-                started_at=started.isoformat(),
-                ended_at=ended.isoformat(),
+                started_at=started_at,
+                ended_at=ended_at,
                 duration_seconds=round(dt_s, 4),
                 error_type=type(e).__name__,
                 error=str(e),
             )
-            console.print(f"[red]Scheduled run failed[/red] {ended.isoformat()} ({dt_s:.2f}s) error={e}")
+            console.print(f"[red]Scheduled run failed[/red] {ended_at} ({dt_s:.2f}s) error={e}")
             try:
                 save_last_failure(error=repr(e), where="scheduler")
             except Exception as save_err:
@@ -109,8 +111,28 @@ def build_scheduler(
             except Exception as e:
                 log_suppressed_exception(context="scheduler.job.release_lock", error=e)
 
+    return job
+
+
+def build_scheduler(
+    cfg: AppConfig,
+    out_dir: Path,
+    console: Console | None = None,
+    *,
+    report_name: str | None = None,
+    csv_out: bool = False,
+    sandbox: bool = False,
+) -> BlockingScheduler:
+    job = make_scheduler_job(
+        cfg,
+        out_dir=out_dir,
+        console=console,
+        report_name=report_name,
+        csv_out=csv_out,
+        sandbox=sandbox,
+    )
     trigger = cron_trigger_from_config(cfg.schedule.cron, cfg.schedule.timezone)
-    scheduler = BlockingScheduler(timezone=tz)
+    scheduler = BlockingScheduler(timezone=resolve_timezone(cfg.schedule.timezone))
     scheduler.add_job(job, trigger, max_instances=1)
     return scheduler
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from apscheduler.triggers.cron import CronTrigger
@@ -20,6 +21,12 @@ def resolve_timezone(name: str | None):
         local_tz = datetime.now().astimezone().tzinfo
         return local_tz or UTC
 
+    return _zone(tz_name)
+
+
+@lru_cache(maxsize=32)
+def _zone(tz_name: str) -> ZoneInfo:
+    # "local" stays uncached: its offset comes from the current clock and shifts across DST.
     try:
         return ZoneInfo(tz_name)
     except Exception as e:
@@ -28,4 +35,13 @@ def resolve_timezone(name: str | None):
 
 def cron_trigger_from_config(cron: str, timezone_name: str | None) -> CronTrigger:
     tz = resolve_timezone(timezone_name)
+    if isinstance(tz, ZoneInfo):
+        return _cron_trigger(cron, tz)
+    return CronTrigger.from_crontab(cron, timezone=tz)
+
+
+@lru_cache(maxsize=32)
+def _cron_trigger(cron: str, tz: ZoneInfo) -> CronTrigger:
+    # Triggers hold no run state (next fire times are computed from the caller's previous time),
+    # so one parsed trigger per (expression, zone) can be shared.
     return CronTrigger.from_crontab(cron, timezone=tz)
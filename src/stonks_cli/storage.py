@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 
+from stonks_cli.io_utils import append_jsonl, write_json_atomic
 from stonks_cli.logging_utils import log_suppressed_exception
 
 
@@ -30,21 +33,47 @@ def history_path() -> Path:
     return default_state_dir() / "history.jsonl"
 
 
+# Last parsed state.json, keyed by (path, st_mtime_ns, st_size) so external edits are picked up.
+_state_cache: tuple[tuple[str, int, int], dict] | None = None
+
+
+def _state_key(path: Path) -> tuple[str, int, int]:
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_state() -> dict:
+    global _state_cache
     path = state_path()
-    if not path.exists():
+    try:
+        key = _state_key(path)
+    except FileNotFoundError:
         return {}
+    if _state_cache is not None and _state_cache[0] == key:
+        # Shallow copy: callers replace top-level entries rather than mutating them.
+        return dict(_state_cache[1])
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        state = json.loads(path.read_bytes())
     except Exception as e:
         log_suppressed_exception(context="storage.load_state", error=e, path=path)
         return {}
+    if not isinstance(state, dict):
+        log_suppressed_exception(
+            context="storage.load_state",
+            error=TypeError(f"state is {type(state).__name__}, expected an object"),
+            path=path,
+        )
+        return {}
+    _state_cache = (key, state)
+    return dict(state)
 
 
 def save_state(state: dict) -> None:
+    global _state_cache
     path = state_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    write_json_atomic(path, state)
+    _state_cache = (_state_key(path), dict(state))
 
 
 def save_last_run(tickers: list[str], report_path: Path | None, json_path: Path | None = None) -> None:
@@ -63,8 +92,7 @@ def save_last_run(tickers: list[str], report_path: Path | None, json_path: Path
 
     hp = history_path()
     hp.parent.mkdir(parents=True, exist_ok=True)
-    with hp.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    append_jsonl(hp, record)
 
 
 def save_last_failure(*, error: str, where: str = "scheduler") -> None:
@@ -78,37 +106,63 @@ def save_last_failure(*, error: str, where: str = "scheduler") -> None:
     save_state(state)
 
 
-def list_history(limit: int = 20) -> list[RunRecord]:
+def _tail_lines(path: Path, limit: int, *, block: int = 8192) -> list[bytes]:
+    """Return the last ``limit`` non-empty lines of ``path`` newest-first, reading backwards in ``block``-sized chunks."""
+    with path.open("rb") as f:
+        pos = f.seek(0, 2)
+        buf = b""
+        # One extra newline so the oldest kept line is known to be complete.
+        while pos > 0 and buf.count(b"\n") <= limit:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    parts = buf.split(b"\n")
+    # parts[0] may be cut mid-line at the block boundary unless the read reached the start of the file.
+    first = 1 if pos > 0 else 0
+    lines: list[bytes] = []
+    for i in range(len(parts) - 1, first - 1, -1):
+        if parts[i].strip():
+            lines.append(parts[i])
+            if len(lines) == limit:
+                break
+    return lines
+
+
+def iter_history(limit: int = 20) -> Iterator[RunRecord]:
+    """Yield up to ``limit`` history records newest-first.
+
+    Only the tail of the file holding the last ``limit`` lines is read.
+    """
     hp = history_path()
-    if not hp.exists():
-        return []
-    lines = hp.read_text(encoding="utf-8").splitlines()
-    records: list[RunRecord] = []
-    # Newest-first ordering.
-    for line in reversed(lines[-limit:]):
+    if not hp.exists() or limit <= 0:
+        return
+    for line in _tail_lines(hp, limit):
         try:
             obj = json.loads(line)
-            records.append(
-                RunRecord(
-                    started_at=str(obj.get("started_at")),
-                    tickers=list(obj.get("tickers") or []),
-                    report_path=obj.get("report_path"),
-                    json_path=obj.get("json_path"),
-                )
+            record = RunRecord(
+                started_at=str(obj.get("started_at")),
+                tickers=list(obj.get("tickers") or []),
+                report_path=obj.get("report_path"),
+                json_path=obj.get("json_path"),
             )
         except Exception as e:
             log_suppressed_exception(context="storage.list_history.parse_line", error=e)
             continue
-    return records
+        yield record
+
+
+def list_history(limit: int = 20) -> list[RunRecord]:
+    return list(iter_history(limit=limit))
 
 
 def get_history_record(index: int, *, limit: int = 2000) -> RunRecord:
     if index < 0:
         raise IndexError("index must be >= 0")
-    records = list_history(limit=limit)
-    if index >= len(records):
+    record = next(islice(iter_history(limit=limit), index, None), None)
+    if record is None:
         raise IndexError("index out of range")
-    return records[index]
+    return record
 
 
 def get_last_report_path() -> Path | None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -8,12 +10,22 @@ from textual.widgets import DataTable, Select
 from stonks_cli.logging_utils import log_suppressed_exception
 
 
+def _watchlist_tickers(cfg, wl_name: str | None) -> tuple[str, ...]:
+    if not wl_name:
+        return tuple(cfg.tickers)
+    return tuple((cfg.watchlists or {}).get(wl_name, []))
+
+
 class WatchlistScreen(Vertical):
     DEFAULT_CLASSES = "screen-widget"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._results = []
+        # Tickers behind the rows currently shown; selecting an equivalent watchlist skips the refetch.
+        self._tickers: tuple[str, ...] = ()
+        self._executor = None
+        self._rows: list[tuple[str, ...]] = []
 
     def compose(self) -> ComposeResult:
         yield Select([], id="wl-select", prompt="select watchlist")
@@ -23,19 +35,34 @@ class WatchlistScreen(Vertical):
         table = self.query_one("#wl-table", DataTable)
         table.add_columns("Ticker", "Price", "Change%", "Signal", "Confidence", "Sparkline")
         table.cursor_type = "row"
-        # populate watchlist selector
+        from concurrent.futures import ThreadPoolExecutor
+
         from stonks_cli.config import load_config
 
         cfg = load_config()
+        # One pool for the screen's lifetime instead of spinning threads up on every refresh.
+        self._executor = ThreadPoolExecutor(max_workers=max(1, cfg.data.concurrency_limit))
+        # populate watchlist selector
         wl = cfg.watchlists or {}
         options = [(name, name) for name in sorted(wl.keys())]
         if options:
             sel = self.query_one("#wl-select", Select)
             sel.set_options(options)
+            # Setting the value posts Select.Changed, which triggers the first refresh.
             sel.value = options[0][1]
-        self.refresh_data()
+        else:
+            self.refresh_data()
+
+    def on_unmount(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
     def on_select_changed(self, event) -> None:
+        from stonks_cli.config import load_config
+
+        value = event.value if event.value != Select.BLANK else None
+        if self._results and _watchlist_tickers(load_config(), value) == self._tickers:
+            return
         self.refresh_data()
 
     def on_data_table_row_selected(self, event) -> None:
@@ -45,8 +72,6 @@ class WatchlistScreen(Vertical):
 
     @work(thread=True)
     def refresh_data(self) -> None:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         from stonks_cli.commands import _fetch_quick_single
         from stonks_cli.config import load_config
         from stonks_cli.formatting.sparkline import generate_sparkline
@@ -56,37 +81,41 @@ class WatchlistScreen(Vertical):
         strategy_fn = select_strategy(cfg)
         sel = self.query_one("#wl-select", Select)
         wl_name = sel.value if sel.value != Select.BLANK else None
-        wl = cfg.watchlists or {}
-        tickers = list(wl.get(wl_name, [])) if wl_name else list(cfg.tickers)
+        tickers = _watchlist_tickers(cfg, wl_name)
         if not tickers:
             return
-        results = []
-        max_workers = min(cfg.data.concurrency_limit, max(1, len(tickers)))
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futs = {ex.submit(_fetch_quick_single, t, cfg, strategy_fn): t for t in tickers}
-            for fut in as_completed(futs):
-                try:
-                    results.append(fut.result())
-                except Exception as e:
-                    log_suppressed_exception(
-                        context="tui.watchlist.refresh_data.fetch_ticker",
-                        error=e,
-                        ticker=futs.get(fut),
-                    )
-        results.sort(key=lambda r: r.ticker)
+
+        def _fetch(t: str):
+            try:
+                return _fetch_quick_single(t, cfg, strategy_fn)
+            except Exception as e:
+                log_suppressed_exception(context="tui.watchlist.refresh_data.fetch_ticker", error=e, ticker=t)
+                return None
+
+        results = [r for r in self._executor.map(_fetch, tickers) if r is not None]
+        results.sort(key=attrgetter("ticker"))
         self._results = results
+        self._tickers = tickers
+
+        rows = []
+        for r in results:
+            price_str = f"${r.price:.2f}" if r.price else "N/A"
+            if r.change_pct is not None:
+                sign = "+" if r.change_pct >= 0 else ""
+                change_str = f"{sign}{r.change_pct:.2f}%"
+            else:
+                change_str = "N/A"
+            spark = generate_sparkline(r.prices, width=15) if r.prices else ""
+            rows.append((r.ticker, price_str, change_str, r.action, f"{r.confidence:.2f}", spark))
+        # A timed refresh that produced the same cells leaves the table (and cursor) alone.
+        if rows == self._rows:
+            return
+        self._rows = rows
 
         def _update():
             table = self.query_one("#wl-table", DataTable)
             table.clear()
-            for r in results:
-                price_str = f"${r.price:.2f}" if r.price else "N/A"
-                if r.change_pct is not None:
-                    sign = "+" if r.change_pct >= 0 else ""
-                    change_str = f"{sign}{r.change_pct:.2f}%"
-                else:
-                    change_str = "N/A"
-                spark = generate_sparkline(r.prices, width=15) if r.prices else ""
-                table.add_row(r.ticker, price_str, change_str, r.action, f"{r.confidence:.2f}", spark, key=r.ticker)
+            for row in rows:
+                table.add_row(*row, key=row[0])
 
         self.app.call_from_thread(_update)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+_PRICE_DEFAULTS = {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.0, "volume": 1000}
+_CLOSE_OFFSETS = {"open": 0.0, "high": 1.0, "low": -1.0}
+
+
+def rising_close(i: int) -> float:
+    """Close of day ``i`` in the shared 120-day fixtures: 100.0, climbing 0.1 a day."""
+
+    return 100.0 + 0.1 * i
+
+
+def write_price_csv(
+    path: Path,
+    n: int,
+    ticker: str,
+    *,
+    start: str = "2024-01-01",
+    end: date | str | None = None,
+    close_fn: Callable[[int], float] | None = None,
+    ohlc_from_close: bool = False,
+    trend: float = 0.0,
+    volume_trend: int = 0,
+    columns: Sequence[str] = ("open", "high", "low", "close", "volume"),
+) -> Path:
+    """Write a daily price CSV (date, *columns, ticker) as plain text.
+
+    Rows run for ``n`` days from ``start``, or up to and including ``end`` when given. ``trend`` is added per
+    day to every price column and ``volume_trend`` to the volume; ``close_fn(i)`` overrides the close outright.
+    With ``ohlc_from_close`` the open follows that close and high/low sit one above/below it, keeping bars valid.
+    """
+
+    first = np.datetime64(end, "D") - (n - 1) if end is not None else np.datetime64(start, "D")
+    dates = np.arange(first, first + n).astype(str)
+    lines = [",".join(("date", *columns, "ticker")) + "\n"]
+    for i, day in enumerate(dates):
+        values = []
+        for c in columns:
+            if c == "close" and close_fn is not None:
+                values.append(close_fn(i))
+            elif ohlc_from_close and close_fn is not None and c in _CLOSE_OFFSETS:
+                values.append(close_fn(i) + _CLOSE_OFFSETS[c])
+            elif c == "volume":
+                values.append(_PRICE_DEFAULTS[c] + volume_trend * i)
+            else:
+                values.append(_PRICE_DEFAULTS[c] + trend * i if trend else _PRICE_DEFAULTS[c])
+        lines.append(",".join((day, *map(str, values), ticker)) + "\n")
+    path.write_bytes("".join(lines).encode("ascii"))
+    return path
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+from _fixtures import rising_close, write_price_csv
+
+
+@pytest.fixture(scope="session")
+def prices_csv_120(tmp_path_factory):
+    """120 days of AAPL.US OHLCV with a slowly rising close; built once per session, treat as read-only."""
+
+    return write_price_csv(tmp_path_factory.mktemp("prices") / "prices.csv", 120, "AAPL.US", close_fn=rising_close)
@@ -1,31 +1,20 @@
 from __future__ import annotations
 
 import json
+import os
 
-import pandas as pd
+import pytest
+from _fixtures import rising_close
+from rich.console import Console
 
+from stonks_cli import pipeline
 from stonks_cli.commands import do_analyze_artifacts
 
 
-def test_analyze_happy_path_with_csv_provider(monkeypatch, tmp_path):
+def test_analyze_happy_path_with_csv_provider(monkeypatch, tmp_path, prices_csv_120):
     cfg_path = tmp_path / "config.json"
     out_dir = tmp_path / "out"
-    csv_path = tmp_path / "prices.csv"
-
-    # Build a minimal but sufficient price series.
-    dates = pd.date_range("2024-01-01", periods=120, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": [100.0 + (i * 0.1) for i in range(len(dates))],
-            "volume": 1000,
-            "ticker": "AAPL.US",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    csv_path = prices_csv_120
 
     cfg_path.write_text(
         json.dumps(
@@ -50,24 +39,10 @@ def test_analyze_happy_path_with_csv_provider(monkeypatch, tmp_path):
     assert payload["results"][0]["ticker"] == "AAPL.US"
 
 
-def test_analyze_respects_start_end_window(monkeypatch, tmp_path):
+def test_analyze_respects_start_end_window(monkeypatch, tmp_path, prices_csv_120):
     cfg_path = tmp_path / "config.json"
     out_dir = tmp_path / "out"
-    csv_path = tmp_path / "prices.csv"
-
-    dates = pd.date_range("2024-01-01", periods=120, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": [100.0 + (i * 0.1) for i in range(len(dates))],
-            "volume": 1000,
-            "ticker": "AAPL.US",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    csv_path = prices_csv_120
 
     cfg_path.write_text(
         json.dumps(
@@ -85,4 +60,77 @@ def test_analyze_respects_start_end_window(monkeypatch, tmp_path):
     assert artifacts.results
     # If end is respected, last_close is lower than the full-series last close.
     assert artifacts.results[0].last_close is not None
-    assert artifacts.results[0].last_close < float(df["close"].iloc[-1])
+    assert artifacts.results[0].last_close < rising_close(119)  # prices_csv_120's final close
+
+
+def test_analysis_runs_on_the_calling_thread_by_default(monkeypatch, tmp_path, prices_csv_120):
+    import threading
+
+    from stonks_cli.config import AppConfig, DataConfig
+
+    threads: list[int] = []
+
+    def record_thread(*args, **kwargs):  # noqa: ANN001
+        threads.append(threading.get_ident())
+        return _real_analyze_one(*args, **kwargs)
+
+    monkeypatch.delenv("STONKS_CLI_WORKERS", raising=False)
+    monkeypatch.setattr(pipeline, "_analyze_one", record_thread)
+    cfg = AppConfig(
+        tickers=["AAPL.US", "MSFT.US"],
+        data=DataConfig(provider="csv", csv_path=str(prices_csv_120), cache_ttl_seconds=0),
+    )
+    pipeline.compute_results(cfg, Console(quiet=True))
+
+    assert len(threads) == 2
+    assert set(threads) == {threading.get_ident()}
+
+
+def test_analyze_with_worker_processes_matches_threads(monkeypatch, tmp_path):
+    import pandas as pd
+
+    from stonks_cli.config import load_config
+    from stonks_cli.pipeline import compute_results
+
+    cfg_path = tmp_path / "config.json"
+    csv_path = tmp_path / "prices.csv"
+    dates = pd.date_range("2024-01-01", periods=120, freq="D")
+    frames = [
+        pd.DataFrame({"date": dates, "close": [100.0 + (i * step) for i in range(len(dates))], "ticker": ticker})
+        for ticker, step in (("AAPL.US", 0.1), ("MSFT.US", -0.1))
+    ]
+    pd.concat(frames).to_csv(csv_path, index=False)
+    cfg_path.write_text(
+        json.dumps(
+            {
+                "tickers": ["AAPL.US", "MSFT.US"],
+                "data": {"provider": "csv", "csv_path": str(csv_path), "cache_ttl_seconds": 0},
+                "risk": {"min_history_days": 60},
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("STONKS_CLI_CONFIG", str(cfg_path))
+
+    threaded, _ = compute_results(load_config(), Console(quiet=True))
+    monkeypatch.setenv("STONKS_CLI_WORKERS", "2")
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    pooled, _ = compute_results(load_config(), Console(quiet=True))
+
+    assert [r.ticker for r in pooled] == ["AAPL.US", "MSFT.US"]
+    assert pooled == threaded
+
+    # A bug raised inside a worker surfaces instead of silently re-running the batch on threads.
+    monkeypatch.setattr(pipeline, "_analyze_one", _fails_in_workers)
+    with pytest.raises(TypeError, match="worker bug"):
+        compute_results(load_config(), Console(quiet=True))
+
+
+_PARENT_PID = os.getpid()
+_real_analyze_one = pipeline._analyze_one
+
+
+def _fails_in_workers(*args, **kwargs):  # noqa: ANN001
+    if os.getpid() != _PARENT_PID:
+        raise TypeError("worker bug")
+    return _real_analyze_one(*args, **kwargs)
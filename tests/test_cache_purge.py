@@ -42,3 +42,20 @@ def test_data_purge_without_threshold_deletes_all(monkeypatch, tmp_path):
     out = do_data_purge()
     assert int(out["deleted"]) >= 2
     assert not any(p.is_file() for p in cache_dir.glob("*.json"))
+
+
+def test_data_purge_keeps_recent_entry_with_old_mtime(monkeypatch, tmp_path):
+    import os
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    cache_dir = default_cache_dir()
+    save_cached_text(cache_dir, "k_recent", "p")
+    (path,) = cache_dir.glob("*.json")
+    # e.g. restored from a backup with its original timestamps: created_at, not mtime, decides.
+    old = time.time() - (10 * 86400)
+    os.utime(path, (old, old))
+
+    out = do_data_purge(older_than_days=1)
+    assert int(out["deleted"]) == 0
+    assert path.is_file()
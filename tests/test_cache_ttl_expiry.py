@@ -20,3 +20,15 @@ def test_cache_ttl_expiry(tmp_path):
     cache_file.write_text(json.dumps(obj), encoding="utf-8")
 
     assert load_cached_text(tmp_path, key, ttl_seconds=60) is None
+
+
+def test_cache_freshness_follows_created_at_not_mtime(tmp_path):
+    import os
+
+    save_cached_text(tmp_path, "k", "fresh")
+    cache_file = next(tmp_path.glob("*.json"))
+    # e.g. restored from a backup with its original timestamps; data purge keeps it, so load must too.
+    old = time.time() - 10_000
+    os.utime(cache_file, (old, old))
+
+    assert load_cached_text(tmp_path, "k", ttl_seconds=60) == "fresh"
@@ -51,3 +51,15 @@ def test_load_config_normalizes_tickers(monkeypatch, tmp_path):
     cfg = load_config()
     assert cfg.tickers == ["AAPL.US"]
     assert "MSFT.US" in cfg.ticker_overrides
+
+
+def test_load_config_reuses_parse_until_file_changes(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.json"
+    monkeypatch.setenv("STONKS_CLI_CONFIG", str(cfg_path))
+
+    cfg_path.write_text(json.dumps({"tickers": ["aapl"]}), encoding="utf-8")
+    first = load_config()
+    assert load_config() is first
+
+    cfg_path.write_text(json.dumps({"tickers": ["aapl", "msft"]}), encoding="utf-8")
+    assert load_config().tickers == ["AAPL.US", "MSFT.US"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-import pandas as pd
+from _fixtures import write_price_csv
 
 from stonks_cli.commands import do_config_validate
 
@@ -11,19 +11,7 @@ def test_config_validate_reports_normalized_tickers_and_providers(monkeypatch, t
     cfg_path = tmp_path / "config.json"
     csv_path = tmp_path / "prices.csv"
 
-    dates = pd.date_range("2024-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": 100.0,
-            "volume": 1000,
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    write_price_csv(csv_path, 10, "AAPL")
 
     cfg_path.write_text(
         json.dumps(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pandas as pd
+import pytest
 
 from stonks_cli.data.providers import CsvProvider
 
@@ -31,3 +32,68 @@ def test_csv_provider_filters_raw_or_suffixed_ticker(tmp_path):
     msft = provider.fetch_daily("MSFT")
     assert msft.ticker == "MSFT.US"
     assert not msft.df.empty
+
+
+def test_csv_provider_batch_reads_file_once(tmp_path, monkeypatch):
+    csv_path = tmp_path / "prices.csv"
+    dates = pd.date_range("2024-01-01", periods=3, freq="D")
+    pd.DataFrame(
+        {
+            "date": list(dates) + list(dates),
+            "close": [1.0, 2.0, 3.0, 10.0, 20.0, 30.0],
+            "ticker": ["AAPL", "AAPL", "AAPL", "MSFT.US", "MSFT.US", "MSFT.US"],
+        }
+    ).to_csv(csv_path, index=False)
+
+    reads: list[str] = []
+    real_read_csv = pd.read_csv
+
+    def counting_read_csv(path, *args, **kwargs):
+        reads.append(str(path))
+        return real_read_csv(path, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+
+    out = CsvProvider(str(csv_path)).fetch_daily_batch(["AAPL", "MSFT"])
+    assert len(reads) == 1
+    assert set(out) == {"AAPL.US", "MSFT.US"}
+    assert out["AAPL.US"].df["close"].tolist() == [1.0, 2.0, 3.0]
+    assert out["MSFT.US"].df["close"].tolist() == [10.0, 20.0, 30.0]
+
+
+def test_csv_provider_bad_dates_only_affect_their_ticker(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text(
+        "date,close,ticker\n2024-01-02,1.0,AAPL\n2024-01-03,2.0,AAPL\n01/03/2024,10.0,MSFT\nbad,20.0,MSFT\n",
+        encoding="utf-8",
+    )
+    provider = CsvProvider(str(csv_path))
+
+    aapl = provider.fetch_daily("AAPL.US")
+    assert aapl.df["close"].tolist() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        provider.fetch_daily("MSFT")
+
+    # The batch path fails on the same rows instead of quietly returning an empty series.
+    with pytest.raises(ValueError):
+        provider.fetch_daily_batch(["AAPL", "MSFT"])
+    assert provider.fetch_daily_batch(["AAPL"])["AAPL.US"].df["close"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("deterministic", [True, False])
+def test_bad_dates_fail_the_same_in_batched_and_sequential_runs(tmp_path, deterministic):
+    from rich.console import Console
+
+    from stonks_cli.config import AppConfig, DataConfig
+    from stonks_cli.pipeline import compute_results
+
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("date,close,ticker\n2024-01-02,1.0,AAPL\nbad,20.0,MSFT\n", encoding="utf-8")
+    cfg = AppConfig(
+        tickers=["AAPL.US", "MSFT.US"],
+        deterministic=deterministic,
+        data=DataConfig(provider="csv", csv_path=str(csv_path), cache_ttl_seconds=0),
+    )
+
+    with pytest.raises(ValueError):
+        compute_results(cfg, Console(quiet=True))
@@ -1,6 +1,6 @@
 import io
 
-import pandas as pd
+from _fixtures import write_price_csv
 from rich.console import Console
 
 from stonks_cli.config import AppConfig, DataConfig, RiskConfig
@@ -10,16 +10,9 @@ from stonks_cli.pipeline import compute_results
 def test_compute_results_populates_data_sufficiency_fields(tmp_path) -> None:
     # Minimal close-only series; ensures missing_columns is populated.
     n = 80
-    dates = pd.date_range("2020-01-01", periods=n, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "ticker": ["TEST" for _ in range(n)],
-            "close": [float(i + 1) for i in range(n)],
-        }
+    csv_path = write_price_csv(
+        tmp_path / "prices.csv", n, "TEST", start="2020-01-01", close_fn=lambda i: float(i + 1), columns=("close",)
     )
-    csv_path = tmp_path / "prices.csv"
-    df.to_csv(csv_path, index=False)
 
     cfg = AppConfig(
         tickers=["TEST.US"],
@@ -35,7 +28,4 @@ def test_compute_results_populates_data_sufficiency_fields(tmp_path) -> None:
     r0 = results[0]
     assert r0.rows_used == n
     assert r0.last_date == "2020-03-20"
-    assert "volume" in (r0.missing_columns or [])
-    assert "high" in (r0.missing_columns or [])
-    assert "low" in (r0.missing_columns or [])
-    assert "open" in (r0.missing_columns or [])
+    assert {"volume", "high", "low", "open"} <= set(r0.missing_columns or ())
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-import pandas as pd
+from _fixtures import write_price_csv
 
 from stonks_cli.commands import do_data_verify
 
@@ -11,19 +11,8 @@ def test_data_verify_flags_missing_close(monkeypatch, tmp_path):
     cfg_path = tmp_path / "config.json"
     csv_path = tmp_path / "prices.csv"
 
-    dates = pd.date_range("2024-01-01", periods=5, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            # intentionally missing close
-            "volume": 1000,
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    # intentionally missing close
+    write_price_csv(csv_path, 5, "AAPL", columns=("open", "high", "low", "volume"))
 
     cfg_path.write_text(
         json.dumps(
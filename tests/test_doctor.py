@@ -2,31 +2,15 @@ from __future__ import annotations
 
 import json
 
-import pandas as pd
-
 from stonks_cli.commands import do_doctor
 
 
-def test_doctor_includes_paths_provider_and_plugins(monkeypatch, tmp_path):
+def test_doctor_includes_paths_provider_and_plugins(monkeypatch, tmp_path, prices_csv_120):
     # Keep state/cache dirs isolated.
     monkeypatch.setenv("HOME", str(tmp_path))
 
     cfg_path = tmp_path / "config.json"
-    csv_path = tmp_path / "prices.csv"
-
-    dates = pd.date_range("2024-01-01", periods=5, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": 100.0,
-            "volume": 1000,
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    csv_path = prices_csv_120
 
     cfg_path.write_text(
         json.dumps(
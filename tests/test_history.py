@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from stonks_cli import storage
+
+
+def test_history_is_newest_first_and_bounded(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "default_state_dir", lambda: tmp_path)
+    for i in range(5):
+        storage.save_last_run([f"T{i}.US"], None)
+
+    records = storage.list_history(limit=3)
+    assert [r.tickers for r in records] == [["T4.US"], ["T3.US"], ["T2.US"]]
+
+    assert storage.get_history_record(1, limit=3).tickers == ["T3.US"]
+    with pytest.raises(IndexError):
+        storage.get_history_record(3, limit=3)
+
+
+def test_state_cache_follows_external_edits(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "default_state_dir", lambda: tmp_path)
+    storage.save_last_run(["AAPL.US"], None)
+    assert storage.get_last_run().tickers == ["AAPL.US"]
+
+    # Another process rewriting state.json must not be masked by the cached copy.
+    storage.state_path().write_text('{"last_run": {"started_at": "x", "tickers": ["MSFT.US", "TSLA.US"]}}')
+    assert storage.get_last_run().tickers == ["MSFT.US", "TSLA.US"]
+
+    # Valid JSON that isn't an object reads as empty state rather than raising.
+    storage.state_path().write_text("[1, 2]")
+    assert storage.load_state() == {}
+    assert storage.get_last_run() is None
+
+
+def test_failed_state_write_keeps_previous_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "default_state_dir", lambda: tmp_path)
+    storage.save_last_run(["AAPL.US"], None)
+    before = storage.state_path().read_text(encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        storage.save_state({"bad": object()})
+
+    assert storage.state_path().read_text(encoding="utf-8") == before
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -23,11 +23,8 @@ def test_json_report_includes_structured_sizing_fields(tmp_path) -> None:
     ]
 
     write_json_report(results, out_path=out, portfolio=None)
-    payload = json.loads(out.read_text(encoding="utf-8"))
+    payload = json.loads(out.read_bytes())
 
     r0 = payload["results"][0]
-    assert r0["suggested_position_fraction"] == 0.15
-    assert r0["vol_annualized"] == 0.30
-    assert r0["atr14"] == 2.5
-    assert r0["stop_loss"] == 118.0
-    assert r0["take_profit"] == 130.0
+    sizing = ("suggested_position_fraction", "vol_annualized", "atr14", "stop_loss", "take_profit")
+    assert tuple(r0[k] for k in sizing) == (0.15, 0.30, 2.5, 118.0, 130.0)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from datetime import date, timedelta
 
-import pandas as pd
+from _fixtures import write_price_csv
 
 from stonks_cli.commands import do_market_snapshot
 
@@ -14,19 +14,7 @@ def test_market_snapshot_includes_core_sections(monkeypatch, tmp_path):
 
     # End date intentionally stale so snapshot can surface freshness warnings.
     end = date.today() - timedelta(days=7)
-    dates = pd.date_range(end=end.isoformat(), periods=90, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": [100.0 + i * 0.2 for i in range(len(dates))],
-            "high": [101.0 + i * 0.2 for i in range(len(dates))],
-            "low": [99.0 + i * 0.2 for i in range(len(dates))],
-            "close": [100.0 + i * 0.2 for i in range(len(dates))],
-            "volume": [1000 + i for i in range(len(dates))],
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    write_price_csv(csv_path, 90, "AAPL", end=end, trend=0.2, volume_trend=1)
 
     cfg_path.write_text(
         json.dumps(
@@ -58,7 +58,102 @@ def test_serialize_helper():
         # Test dict
         assert _serialize({"a": 1}) == {"a": 1}
 
+        # pandas/numpy values are reduced to native primitives
+        import numpy as np
+        import pandas as pd
+
+        out = _serialize({"s": pd.Series([1.5, 2.5]), "n": np.int64(3), "p": [p]})
+        assert out == {"s": [1.5, 2.5], "n": 3, "p": ["/tmp/test"]}
+        assert type(out["n"]) is int
+
     except ImportError as e:
         if "mcp" in str(e):
             pytest.skip("MCP optional dependency not installed")
         raise
+
+
+def test_chart_tools_share_single_fetch(monkeypatch):
+    """Chart tools for the same ticker reuse one provider fetch."""
+    try:
+        import pandas as pd
+
+        from stonks_cli import mcp_server
+        from stonks_cli.data.providers import PriceSeries
+    except ImportError as e:
+        if "mcp" in str(e):
+            pytest.skip("MCP optional dependency not installed")
+        raise
+
+    idx = pd.date_range("2024-01-01", periods=260, freq="D")
+    df = pd.DataFrame(
+        {
+            "open": [100.0 + i for i in range(260)],
+            "high": [101.0 + i for i in range(260)],
+            "low": [99.0 + i for i in range(260)],
+            "close": [100.0 + i for i in range(260)],
+            "volume": [1000] * 260,
+        },
+        index=idx,
+    )
+    calls: list[str] = []
+
+    class _Provider:
+        def fetch_daily(self, ticker: str) -> PriceSeries:
+            calls.append(ticker)
+            return PriceSeries(ticker=ticker, df=df)
+
+    monkeypatch.setattr(mcp_server, "_fetch_cache", {})
+    monkeypatch.setattr(mcp_server, "load_config", lambda: object())
+    monkeypatch.setattr(mcp_server, "provider_for_config", lambda cfg, t: _Provider())
+
+    mcp_server.get_chart_data("aapl", days=30)
+    mcp_server.get_chart_rsi_data("AAPL", days=30)
+    bundle = mcp_server.prefetch_chart_bundle("AAPL", days=30)
+
+    assert calls == ["AAPL.US"]
+    assert len(bundle["dates"]) == 30
+    assert set(bundle["sma"]) == {"20", "50", "200"}
+    assert bundle["sma"]["200"][-1] is not None
+    assert len(bundle["candles"]["open"]) == 30
+    assert len(bundle["bollinger"]["upper"]) == 30
+
+
+def test_read_only_tools_are_cached_until_invalidated(monkeypatch):
+    """Polled getters reuse results until a write tool invalidates them."""
+    try:
+        from stonks_cli import mcp_server
+    except ImportError as e:
+        if "mcp" in str(e):
+            pytest.skip("MCP optional dependency not installed")
+        raise
+
+    calls: list[int] = []
+
+    def fake_show(include_total: bool = False) -> dict:
+        calls.append(1)
+        return {"positions": len(calls)}
+
+    monkeypatch.setattr(mcp_server, "_tool_cache", {})
+    monkeypatch.setattr(mcp_server, "do_portfolio_show", fake_show)
+    monkeypatch.setattr(mcp_server, "do_paper_buy", lambda ticker, shares: {"ticker": ticker})
+
+    assert mcp_server.get_portfolio() == {"positions": 1}
+    assert mcp_server.get_portfolio() == {"positions": 1}
+    assert len(calls) == 1
+
+    mcp_server.paper_buy("AAPL", 1)
+    assert mcp_server.get_portfolio() == {"positions": 2}
+
+    # Config reads are never held past the call, and analysis runs refresh the cache listing.
+    monkeypatch.setattr(mcp_server, "do_config_show", lambda: {"n": len(calls)})
+    assert mcp_server.get_config() == {"config": {"n": 2}}
+    calls.append(1)
+    assert mcp_server.get_config() == {"config": {"n": 3}}
+
+    entries: list[int] = []
+    monkeypatch.setattr(mcp_server, "do_data_cache_info", lambda: {"entries": len(entries)})
+    monkeypatch.setattr(mcp_server, "do_analyze", lambda **kwargs: "report.txt")
+    assert mcp_server.get_cache_info() == {"entries": 0}
+    entries.append(1)
+    mcp_server.run_analysis(["AAPL"])
+    assert mcp_server.get_cache_info() == {"entries": 1}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from stonks_cli import paths
+from stonks_cli.portfolio import paper
+
+
+def test_paper_history_replay_counts_sells_and_initial_cash(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    paper.init_paper_portfolio(5000.0)
+    paper.paper_buy("aapl", 10, 100.0)
+    paper.paper_sell("AAPL", 4, 110.0)
+    # A ticker literally named SELL must not be mistaken for a sell record.
+    paper.paper_buy("SELL", 1, 10.0)
+    with paper.get_paper_history_path().open("a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    assert paper.paper_initial_cash() == 5000.0
+    perf = paper.calculate_paper_performance(paper.load_paper_portfolio(), 5000.0)
+    assert perf["num_trades"] == 1
+    assert perf["best_trade"]["gain_loss"] == 40.0
+
+
+def test_paper_history_log_survives_file_removal(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    paper.log_paper_transaction("INIT", "CASH", 100.0, 1.0)
+    # `stonks paper reset` deletes the file while a long-lived process may hold it open.
+    paper.get_paper_history_path().unlink()
+    paper.log_paper_transaction("INIT", "CASH", 200.0, 1.0)
+
+    assert paper.paper_initial_cash() == 200.0
+
+
+def test_paper_performance_is_cached_and_follows_resets(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    paper.init_paper_portfolio(1000.0)
+    paper.log_paper_transaction("SELL", "AAPL", 1, 150.0, gain_loss=50.0)
+    perf = paper.calculate_paper_performance(paper.load_paper_portfolio(), 1000.0)
+    assert perf["num_trades"] == 1
+    assert paper._paper_stats_path().exists()
+
+    # Only the appended trade is folded into the cached aggregate.
+    paper.log_paper_transaction("SELL", "AAPL", 1, 50.0, gain_loss=-50.0)
+    perf = paper.calculate_paper_performance(paper.load_paper_portfolio(), 1000.0)
+    assert (perf["num_trades"], perf["win_rate"]) == (2, 50.0)
+    assert perf["worst_trade"]["gain_loss"] == -50.0
+    assert abs(perf["max_drawdown"] - 50.0 / 1050.0) < 1e-12
+
+    paper.init_paper_portfolio(1000.0)
+    perf = paper.calculate_paper_performance(paper.load_paper_portfolio(), 1000.0)
+    assert (perf["num_trades"], perf["best_trade"]) == (0, None)
+
+
+def test_paper_reset_command_drops_cached_performance(monkeypatch, tmp_path):
+    from typer.testing import CliRunner
+
+    from stonks_cli.cli import app
+
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    paper.init_paper_portfolio(1000.0)
+    paper.log_paper_transaction("SELL", "AAPL", 1, 150.0, gain_loss=50.0)
+    paper.calculate_paper_performance(paper.load_paper_portfolio(), 1000.0)
+    assert paper._paper_stats_path().exists()
+
+    result = CliRunner().invoke(app, ["paper", "reset", "--force"])
+    assert result.exit_code == 0, result.stdout
+    assert not paper._paper_stats_path().exists()
+    assert not paper.get_paper_history_path().exists()
+    assert not paper.get_paper_portfolio_path().exists()
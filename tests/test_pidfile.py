@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from stonks_cli.scheduler import pidfile
+
+
+def test_pid_check_falls_back_to_signal_when_proc_entry_is_hidden(monkeypatch):
+    # hidepid: another user's live process has no visible /proc entry, and signalling it is refused.
+    monkeypatch.setattr(pidfile, "_HAS_PROCFS", True)
+    monkeypatch.setattr(pidfile.os.path, "isdir", lambda p: False)
+
+    def refuse(pid, sig):  # noqa: ANN001
+        raise PermissionError
+
+    monkeypatch.setattr(pidfile.os, "kill", refuse)
+    assert pidfile._pid_is_running(12345) is True
+
+
+def test_acquire_pid_file_rejects_live_pid_and_replaces_stale(tmp_path):
+    path = tmp_path / "scheduler.pid"
+    path.write_text(str(os.getpid()), encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        pidfile.acquire_pid_file(path)
+
+    path.write_text("999999999", encoding="utf-8")
+    pidfile.acquire_pid_file(path)
+    assert path.read_text(encoding="utf-8") == str(os.getpid())
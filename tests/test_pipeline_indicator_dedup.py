@@ -1,6 +1,6 @@
 import io
 
-import pandas as pd
+from _fixtures import write_price_csv
 from rich.console import Console
 
 from stonks_cli.config import AppConfig, DataConfig, RiskConfig
@@ -10,21 +10,9 @@ from stonks_cli.pipeline import compute_results
 def test_pipeline_precomputes_indicators_once_for_builtins(monkeypatch, tmp_path):
     # Create deterministic price history sufficient for SMA cross.
     n = 220
-    dates = pd.date_range("2020-01-01", periods=n, freq="D")
-    close = pd.Series(range(1, n + 1), index=dates, dtype=float)
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "ticker": ["TEST" for _ in range(n)],
-            "open": close.values,
-            "high": (close + 1).values,
-            "low": (close - 1).values,
-            "close": close.values,
-            "volume": [1000 for _ in range(n)],
-        }
+    csv_path = write_price_csv(
+        tmp_path / "prices.csv", n, "TEST", start="2020-01-01", close_fn=lambda i: float(i + 1), ohlc_from_close=True
     )
-    csv_path = tmp_path / "prices.csv"
-    df.to_csv(csv_path, index=False)
 
     cfg = AppConfig(
         tickers=["TEST.US"],
@@ -2,12 +2,10 @@ from __future__ import annotations
 
 import json
 
-import pandas as pd
-
 from stonks_cli.commands import do_analyze_artifacts
 
 
-def test_plugin_strategy_is_loaded_and_used(monkeypatch, tmp_path):
+def test_plugin_strategy_is_loaded_and_used(monkeypatch, tmp_path, prices_csv_120):
     plugin_path = tmp_path / "my_plugin.py"
     plugin_path.write_text(
         "from stonks_cli.analysis.strategy import Recommendation\n"
@@ -19,21 +17,7 @@ def test_plugin_strategy_is_loaded_and_used(monkeypatch, tmp_path):
 
     cfg_path = tmp_path / "config.json"
     out_dir = tmp_path / "out"
-    csv_path = tmp_path / "prices.csv"
-
-    dates = pd.date_range("2024-01-01", periods=120, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": [100.0 + (i * 0.1) for i in range(len(dates))],
-            "volume": 1000,
-            "ticker": "AAPL.US",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    csv_path = prices_csv_120
 
     cfg_path.write_text(
         json.dumps(
@@ -53,3 +37,54 @@ def test_plugin_strategy_is_loaded_and_used(monkeypatch, tmp_path):
     report_txt = artifacts.report_path.read_text(encoding="utf-8")
     assert "BUY_DCA" in report_txt
     assert "plugin" in report_txt
+
+
+def test_file_plugin_module_is_reused_until_modified(tmp_path):
+    import os
+
+    from stonks_cli.plugins import _load_module
+
+    plugin_path = tmp_path / "counting_plugin.py"
+    plugin_path.write_text("VERSION = 1\n", encoding="utf-8")
+
+    first = _load_module(str(plugin_path))
+    assert _load_module(str(plugin_path)) is first
+
+    plugin_path.write_text("VERSION = 2\n", encoding="utf-8")
+    st = plugin_path.stat()
+    os.utime(plugin_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    reloaded = _load_module(str(plugin_path))
+    assert reloaded is not first
+    assert reloaded.VERSION == 2
+
+
+def test_file_plugin_cache_is_bounded(monkeypatch, tmp_path):
+    from stonks_cli import plugins
+
+    monkeypatch.setattr(plugins, "_MODULE_CACHE", plugins.OrderedDict())
+    monkeypatch.setattr(plugins, "_MODULE_CACHE_MAX", 2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"bounded_{i}.py"
+        path.write_text(f"N = {i}\n", encoding="utf-8")
+        paths.append(str(path.resolve()))
+        plugins._load_module(str(path))
+
+    assert list(plugins._MODULE_CACHE) == paths[1:]
+
+
+def test_file_plugin_can_define_dataclasses(tmp_path):
+    from stonks_cli.plugins import _load_module
+
+    plugin_path = tmp_path / "dc_plugin.py"
+    plugin_path.write_text(
+        "from __future__ import annotations\n"
+        "from dataclasses import dataclass\n"
+        "@dataclass\n"
+        "class Params:\n"
+        "    window: int = 5\n",
+        encoding="utf-8",
+    )
+
+    module = _load_module(str(plugin_path))
+    assert module.Params().window == 5
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from stonks_cli.portfolio.analysis import calculate_portfolio_allocation
+from stonks_cli.portfolio.models import Portfolio, Position
+
+
+def test_allocation_groups_lots_by_ticker_and_includes_cash():
+    d = date(2024, 1, 1)
+    portfolio = Portfolio(
+        positions=[Position("MSFT", 2, 1.0, d), Position("AAPL", 1, 1.0, d), Position("MSFT", 1, 1.0, d)],
+        cash_balance=10.0,
+    )
+
+    out = calculate_portfolio_allocation(portfolio, {"AAPL": 10.0, "MSFT": 5.0})
+
+    assert list(out) == ["MSFT", "AAPL", "CASH"]
+    assert out["MSFT"] == pytest.approx(15 / 35 * 100)
+    assert out["AAPL"] == pytest.approx(10 / 35 * 100)
+    assert out["CASH"] == pytest.approx(10 / 35 * 100)
+    assert calculate_portfolio_allocation(Portfolio(), {}) == {}
@@ -19,5 +19,6 @@ def test_portfolio_backtest_summary_is_in_header(tmp_path: Path):
     text = report_path.read_text(encoding="utf-8")
 
     # The portfolio summary should appear before the main per-ticker table.
-    assert text.find("Portfolio Backtest") != -1
-    assert text.find("Portfolio Backtest") < text.find("Ticker")
+    header = text.index("Portfolio Backtest")
+    assert "Ticker" not in text[:header]
+    assert "Ticker" in text[header:]
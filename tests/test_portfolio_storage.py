@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from stonks_cli import paths
+from stonks_cli.portfolio import storage
+
+
+def test_position_changes_are_journaled_and_compacted(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    storage.add_position("aapl", 10, 100.0)
+    storage.add_position("AAPL", 5, 120.0)
+    assert not storage.get_portfolio_path().exists()
+
+    out = storage.remove_position("AAPL", 12, 150.0)
+    assert out["cost_basis"] == 10 * 100.0 + 2 * 120.0
+
+    positions = storage.load_portfolio().positions
+    assert [(p.ticker, p.shares) for p in positions] == [("AAPL", 3)]
+
+    # Crossing the size threshold folds the journal into portfolio.json.
+    monkeypatch.setattr(storage, "_JOURNAL_COMPACT_BYTES", 0)
+    storage.add_position("MSFT", 1, 300.0)
+    assert not storage.get_journal_path().exists()
+    snapshot = json.loads(storage.get_portfolio_path().read_text(encoding="utf-8"))
+    assert [(p["ticker"], p["shares"]) for p in snapshot["positions"]] == [("AAPL", 3), ("MSFT", 1)]
+
+
+def test_failed_save_keeps_previous_portfolio(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    storage.save_portfolio(storage.Portfolio(cash_balance=50.0))
+    before = storage.get_portfolio_path().read_text(encoding="utf-8")
+
+    monkeypatch.setattr(storage.Portfolio, "to_dict", lambda self: {"bad": object()})
+    with pytest.raises(TypeError):
+        storage.save_portfolio(storage.Portfolio(cash_balance=75.0))
+
+    assert storage.get_portfolio_path().read_text(encoding="utf-8") == before
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_journal_left_by_interrupted_save_is_not_replayed(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "default_data_dir", lambda: tmp_path)
+
+    storage.add_position("AAPL", 10, 100.0)
+    journal = storage.get_journal_path()
+    leftover = journal.read_bytes()
+
+    # Snapshot written, then the process dies before the journal is removed.
+    storage.save_portfolio(storage.load_portfolio())
+    journal.write_bytes(leftover)
+    assert [(p.ticker, p.shares) for p in storage.load_portfolio().positions] == [("AAPL", 10)]
+
+    # Changes after that go into a new journal, which is replayed.
+    journal.unlink()
+    storage.add_position("MSFT", 1, 300.0)
+    assert [(p.ticker, p.shares) for p in storage.load_portfolio().positions] == [("AAPL", 10), ("MSFT", 1)]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from stonks_cli.data import ratelimit
+from stonks_cli.data.ratelimit import RateLimiter
+
+
+def test_rate_limiter_disabled_never_sleeps(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+
+    limiter = RateLimiter(0)
+    for _ in range(5):
+        limiter.acquire()
+
+    assert sleeps == []
+
+
+def test_rate_limiter_spaces_calls(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+
+    limiter = RateLimiter(4.0)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [0.25, 0.5]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-import pandas as pd
+from _fixtures import rising_close, write_price_csv
 
 from stonks_cli.commands import do_analyze_artifacts, do_report_latest
 
@@ -15,19 +15,8 @@ def test_report_latest_returns_json_path_when_available(monkeypatch, tmp_path):
     out_dir = tmp_path / "out"
     csv_path = tmp_path / "prices.csv"
 
-    dates = pd.date_range("2024-01-01", periods=120, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": [100.0 + (i * 0.1) for i in range(len(dates))],
-            "volume": 1000,
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    # Bare symbol in both the CSV and the config, unlike the shared AAPL.US fixture.
+    write_price_csv(csv_path, 120, "AAPL", close_fn=rising_close)
 
     cfg_path.write_text(
         json.dumps(
@@ -1,28 +1,12 @@
 import json
 
-import pandas as pd
-
 from stonks_cli.commands import do_analyze_artifacts
 
 
-def test_analyze_report_name_writes_stable_filename(monkeypatch, tmp_path):
+def test_analyze_report_name_writes_stable_filename(monkeypatch, tmp_path, prices_csv_120):
     cfg_path = tmp_path / "config.json"
     out_dir = tmp_path / "out"
-    csv_path = tmp_path / "prices.csv"
-
-    dates = pd.date_range("2024-01-01", periods=120, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": 100.0,
-            "high": 101.0,
-            "low": 99.0,
-            "close": [100.0 + (i * 0.1) for i in range(len(dates))],
-            "volume": 1000,
-            "ticker": "AAPL.US",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    csv_path = prices_csv_120
 
     cfg_path.write_text(
         json.dumps(
@@ -20,4 +20,6 @@ def test_text_report_is_sorted_by_action_and_confidence(tmp_path: Path):
     text = report_path.read_text(encoding="utf-8")
 
     # BUY actions should come before AVOID actions, regardless of confidence.
-    assert text.find("AAA.US") < text.find("ZZZ.US")
+    first = text.index("AAA.US")
+    assert "ZZZ.US" not in text[:first]
+    assert "ZZZ.US" in text[first:]
@@ -24,3 +24,20 @@ def test_resolve_timezone_invalid_raises():
 def test_cron_trigger_uses_configured_timezone():
     trigger = cron_trigger_from_config("0 17 * * 1-5", "UTC")
     assert str(trigger.timezone) == "UTC"
+    assert cron_trigger_from_config("0 17 * * 1-5", "UTC") is trigger
+
+
+def test_build_scheduler_registers_cron_job_in_configured_timezone(tmp_path):
+    from apscheduler.triggers.cron import CronTrigger
+
+    from stonks_cli.config import AppConfig, ScheduleConfig
+    from stonks_cli.scheduler.run import build_scheduler
+
+    cfg = AppConfig(schedule=ScheduleConfig(cron="0 17 * * 1-5", timezone="UTC"))
+    scheduler = build_scheduler(cfg, out_dir=tmp_path)  # never started
+
+    (job,) = scheduler.get_jobs()
+    assert isinstance(job.trigger, CronTrigger)
+    assert str(job.trigger.timezone) == "UTC"
+    assert str(job.trigger) == str(cron_trigger_from_config("0 17 * * 1-5", "UTC"))
+    assert job.max_instances == 1
@@ -4,11 +4,12 @@ from stonks_cli.analysis.indicators import sma
 
 
 def test_rsi_in_range():
+    import numpy as np
     import pandas as pd
 
     from stonks_cli.analysis.indicators import rsi
 
-    close = pd.Series([100 + i for i in range(50)])
+    close = pd.Series(np.arange(100, 150, dtype=np.float64))
     out = rsi(close, 14)
     last = float(out.dropna().iloc[-1])
     assert 0.0 <= last <= 100.0
@@ -20,3 +21,37 @@ def test_sma_has_expected_length():
     s = pd.Series([1, 2, 3, 4, 5])
     out = sma(s, 3)
     assert len(out) == 5
+
+
+def test_sma_many_and_cumsum_bollinger_match_rolling():
+    import numpy as np
+    import pandas as pd
+
+    from stonks_cli.analysis.indicators import bollinger_bands, bollinger_bands_cumsum, sma_many
+
+    close = pd.Series([100 + (i % 7) * 1.5 + i * 0.1 for i in range(260)])
+    many = sma_many(close, [20, 50, 200])
+    for w in (20, 50, 200):
+        np.testing.assert_allclose(many[w].to_numpy(), sma(close, w).to_numpy(), equal_nan=True)
+
+    for got, want in zip(bollinger_bands_cumsum(close), bollinger_bands(close), strict=True):
+        np.testing.assert_allclose(got.to_numpy(), want.to_numpy(), equal_nan=True, rtol=1e-9)
+
+
+def test_last_atr_and_volatility_match_rolling():
+    import numpy as np
+    import pandas as pd
+
+    from stonks_cli.analysis.indicators import atr, last_atr, last_rolling_volatility, rolling_volatility
+
+    rng = np.random.default_rng(1)
+    close = pd.Series(100 + rng.normal(0, 1, 300).cumsum())
+    high = close + rng.uniform(0, 2, 300)
+    low = close - rng.uniform(0, 2, 300)
+
+    for n in (5, 14, 15, 21, 300):
+        h, lo, c = high.iloc[:n], low.iloc[:n], close.iloc[:n]
+        np.testing.assert_allclose(last_atr(h, lo, c, 14), atr(h, lo, c, 14).iloc[-1], equal_nan=True)
+        np.testing.assert_allclose(
+            last_rolling_volatility(c, 20), rolling_volatility(c, 20).iloc[-1], rtol=1e-9, equal_nan=True
+        )
@@ -3,8 +3,8 @@ from __future__ import annotations
 import json
 from datetime import date
 
-import pandas as pd
 import pytest
+from _fixtures import write_price_csv
 from typer.testing import CliRunner
 
 from stonks_cli.cli import app
@@ -14,19 +14,7 @@ def _configure_csv_snapshot_env(monkeypatch, tmp_path):
     cfg_path = tmp_path / "config.json"
     csv_path = tmp_path / "prices.csv"
 
-    dates = pd.date_range(end=date.today().isoformat(), periods=90, freq="D")
-    df = pd.DataFrame(
-        {
-            "date": dates,
-            "open": [100.0 + i * 0.1 for i in range(len(dates))],
-            "high": [101.0 + i * 0.1 for i in range(len(dates))],
-            "low": [99.0 + i * 0.1 for i in range(len(dates))],
-            "close": [100.0 + i * 0.1 for i in range(len(dates))],
-            "volume": [1000 + i for i in range(len(dates))],
-            "ticker": "AAPL",
-        }
-    )
-    df.to_csv(csv_path, index=False)
+    write_price_csv(csv_path, 90, "AAPL", end=date.today(), trend=0.1, volume_trend=1)
 
     cfg_path.write_text(
         json.dumps(
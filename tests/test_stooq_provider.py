@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-import pandas as pd
-
 from stonks_cli.data.providers import StooqProvider
 
 
@@ -26,6 +24,8 @@ class _Session:
 
 
 def test_stooq_provider_parses_and_sorts_dates(tmp_path):
+    import pandas as pd
+
     csv = """Date,Open,High,Low,Close,Volume
 2025-01-03,10,11,9,10.5,100
 2025-01-02,9,10,8,9.5,200
@@ -41,4 +41,5 @@ def test_stooq_provider_parses_and_sorts_dates(tmp_path):
     assert isinstance(df.index, pd.DatetimeIndex)
     assert list(df.index) == sorted(df.index)
     assert "close" in df.columns
-    assert float(df.loc[pd.Timestamp("2025-01-02"), "close"]) == 9.5
+    # Rows arrive newest-first; after sorting, the 2025-01-02 bar leads.
+    assert float(df["close"].iloc[0]) == 9.5
@@ -1,12 +1,37 @@
 from functools import partial
 
+import pytest
+
+from stonks_cli.analysis.strategy import sma_cross_strategy
 from stonks_cli.config import AppConfig
+from stonks_cli.errors import BadConfigError
 from stonks_cli.pipeline import select_strategy
 
 
 def test_strategy_params_wraps_sma_cross_with_partial() -> None:
     cfg = AppConfig(strategy="sma_cross", strategy_params={"fast": 10, "slow": 30})
     fn = select_strategy(cfg)
-    assert isinstance(fn, partial)
-    assert fn.func.__name__ == "sma_cross_strategy"
+    # A plain partial over the built-in itself (no wrapper) keeps the vectorized backtest path.
+    assert type(fn) is partial
+    assert fn.func is sma_cross_strategy
     assert fn.keywords == {"fast": 10, "slow": 30}
+
+
+@pytest.mark.parametrize(
+    ("strategy", "params"),
+    [
+        ("basic_trend_rsi", {"rsi_window": "fourteen"}),
+        ("mean_reversion_bb_rsi", {"bb_num_std": [2]}),
+        ("sma_cross", {"fast": None}),
+    ],
+)
+def test_invalid_strategy_param_is_reported_as_bad_config(strategy, params) -> None:
+    cfg = AppConfig(strategy=strategy, strategy_params=params)
+    (name,) = params
+    with pytest.raises(BadConfigError, match=f"strategy_params.{name} for '{strategy}'"):
+        select_strategy(cfg)
+
+
+def test_numeric_strategy_params_are_coerced() -> None:
+    cfg = AppConfig(strategy="basic_trend_rsi", strategy_params={"rsi_window": 14.0, "sma_fast": "10"})
+    assert select_strategy(cfg).keywords == {"sma_fast": 10, "rsi_window": 14}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import importlib
+import sys
 
 import pytest
 
@@ -8,15 +8,31 @@ from stonks_cli.data.providers import YFinanceProvider
 
 
 def test_yfinance_provider_requires_optional_dependency(monkeypatch):
-    real_import = importlib.import_module
-
-    def fake_import(name: str, package=None):
-        if name == "yfinance":
-            raise ImportError("nope")
-        return real_import(name, package)
-
-    monkeypatch.setattr(importlib, "import_module", fake_import)
+    # A None entry makes any import of yfinance fail with ImportError, installed or not.
+    monkeypatch.setitem(sys.modules, "yfinance", None)
 
     p = YFinanceProvider()
     with pytest.raises(ImportError):
         p.fetch_daily("AAPL")
+
+
+def test_yfinance_batch_keeps_tickers_sharing_a_symbol(monkeypatch):
+    import types
+
+    import pandas as pd
+
+    frame = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2, freq="D"))
+    raw = pd.concat({"X": frame, "Y": frame * 10}, axis=1)
+    calls: list[list[str]] = []
+
+    def download(symbols, **kwargs):  # noqa: ANN001
+        calls.append(list(symbols))
+        return raw
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(download=download))
+
+    out = YFinanceProvider().fetch_daily_batch(["X.US", "X.L", "Y"])
+    assert calls == [["X", "Y"]]
+    assert set(out) == {"X.US", "X.L", "Y.US"}
+    assert out["X.L"].df["close"].tolist() == [1.0, 2.0]
+    assert out["Y.US"].df["close"].tolist() == [10.0, 20.0]